@@ -14,13 +14,28 @@ Functions:
         step in inclusion criteria
 """
 
-from pyspark.sql import DataFrame, Window
+from pyspark.sql import Column, DataFrame
 from pyspark.sql import functions as F
+from pyspark.sql.types import IntegerType, LongType, StringType, StructField, StructType
 from pyspark.sql.utils import AnalysisException
 
 from .environment_utils import get_spark_session
 from .table_management import save_table
 
+# Explicit flowchart schema, so createDataFrame skips schema inference
+_FLOWCHART_SCHEMA = StructType(
+    [
+        StructField("criteria_index", IntegerType(), True),
+        StructField("criteria", StringType(), False),
+        StructField("description", StringType(), True),
+        StructField("expression", StringType(), True),
+        StructField("n_row", LongType(), False),
+        StructField("n_distinct_id", LongType(), False),
+        StructField("excluded_rows", LongType(), True),
+        StructField("excluded_ids", LongType(), True),
+    ]
+)
+
 
 def apply_inclusion_criteria(
     cohort: DataFrame,
@@ -29,6 +44,8 @@ def apply_inclusion_criteria(
     row_id_col: str = "row_id",
     person_id_col: str = "person_id",
     drop_inclusion_flags: bool = True,
+    order_criteria: bool = False,
+    exact_distinct: bool = True,
 ) -> DataFrame:
     """Apply inclusion criteria to the cohort and optionally generate a flowchart table.
 
@@ -40,6 +57,11 @@ def apply_inclusion_criteria(
         person_id_col (str, optional): Person ID column name. Defaults to "person_id".
         drop_inclusion_flags (bool, optional): Drop flag columns after filtering.
             Defaults to True.
+        order_criteria (bool, optional): Apply criteria from most to least selective,
+            estimated on a sample of the cohort. This changes the order of the
+            `criteria_*` columns and flowchart steps. Defaults to False.
+        exact_distinct (bool, optional): Count distinct persons in the flowchart
+            exactly rather than approximately. Defaults to True.
 
     Returns:
         DataFrame: Filtered cohort DataFrame.
@@ -64,27 +86,39 @@ def apply_inclusion_criteria(
     # Validate cohort columns to ensure no forbidden columns are present or conflicting
     validate_cohort_columns(cohort, inclusion_criteria, row_id_col, person_id_col)
 
+    # Optionally reorder criteria so the most selective are evaluated first
+    if order_criteria and inclusion_criteria:
+        inclusion_criteria = order_inclusion_criteria(cohort, inclusion_criteria)
+
+    # Without a flowchart or retained flags, filter on all criteria in one predicate
+    # so Spark can push it down to the data source
+    if not flowchart_table and drop_inclusion_flags:
+        if not inclusion_criteria:
+            return cohort
+        predicate = balanced_and(parse_inclusion_criteria(inclusion_criteria))
+        return cohort.filter(predicate)
+
     # Add columns to cohort DataFrame flagging rows that meet each inclusion criterion
     cohort_flagged = create_inclusion_columns(cohort, inclusion_criteria)
 
     # If flowchart_table key is provided, generate and save the flowchart
     if flowchart_table:
         flowchart = create_inclusion_flowchart(
-            cohort_flagged, inclusion_criteria, row_id_col, person_id_col
+            cohort_flagged,
+            inclusion_criteria,
+            row_id_col,
+            person_id_col,
+            exact_distinct=exact_distinct,
         )
         save_table(df=flowchart, table=flowchart_table)
 
     # Filter the cohort to only rows that meet all inclusion criteria (include == True)
     cohort_filtered = cohort_flagged.filter(F.col("include"))
 
-    # Optionally drop the inclusion flag columns and intermediate criteria columns
+    # Optionally drop the inclusion flag columns and intermediate criteria columns by
+    # projecting only the original cohort columns
     if drop_inclusion_flags:
-        columns_to_drop = (
-            [f"criteria_{i}" for i in range(len(inclusion_criteria) + 1)]
-            + list(inclusion_criteria.keys())
-            + ["include"]
-        )
-        cohort_filtered = cohort_filtered.drop(*columns_to_drop)
+        cohort_filtered = cohort_filtered.select(*cohort.columns)
 
     return cohort_filtered
 
@@ -104,25 +138,37 @@ def create_inclusion_columns(
             - `criteria_*` boolean columns for each inclusion criterion, and
             - an `include` column indicating if all criteria are met.
     """
-    # Add a column for each inclusion criterion based on its SQL expression
-    for column_name, sql_expression in inclusion_criteria.items():
-        cohort = cohort.withColumn(column_name, F.expr(sql_expression))
-
-    # Replace nulls in inclusion columns with False (missing does not meet criteria)
-    cohort = cohort.fillna(False, list(inclusion_criteria.keys()))
-
-    # Start criteria chain with a column always True (base case for cumulative AND)
-    cohort = cohort.withColumn("criteria_0", F.lit(True))
+    # Add a flag column per criterion and the base of the cumulative chain in one
+    # projection, treating nulls as not meeting the criterion
+    cohort_flagged = cohort.select(
+        "*",
+        *[
+            criteria_flag.alias(column_name)
+            for column_name, criteria_flag in zip(
+                inclusion_criteria.keys(),
+                parse_inclusion_criteria(inclusion_criteria),
+                strict=True,
+            )
+        ],
+        F.lit(True).alias("criteria_0"),
+    )
 
-    # Create cumulative AND columns to check if all criteria up to current are True
+    # Add each cumulative AND column in its own projection, reading the previous
+    # chain column rather than inlining it, so expression size stays constant per
+    # step instead of growing with the number of criteria. The flags are never
+    # null, so the generated AND skips each criterion on rows that failed an
+    # earlier one whenever the flag columns are not selected downstream
     for index, column_name in enumerate(inclusion_criteria.keys(), start=1):
-        cohort = cohort.withColumn(
-            f"criteria_{index}", F.col(f"criteria_{index - 1}") & F.col(column_name)
+        cohort_flagged = cohort_flagged.select(
+            "*",
+            (F.col(f"criteria_{index - 1}") & F.col(column_name)).alias(
+                f"criteria_{index}"
+            ),
         )
 
     # Final 'include' column is True only if all criteria are met
-    cohort_flagged = cohort.withColumn(
-        "include", F.col(f"criteria_{len(inclusion_criteria)}")
+    cohort_flagged = cohort_flagged.select(
+        "*", F.col(f"criteria_{len(inclusion_criteria)}").alias("include")
     )
 
     return cohort_flagged
@@ -133,6 +179,7 @@ def create_inclusion_flowchart(
     inclusion_criteria: dict[str, str],
     row_id_col: str = "row_id",
     person_id_col: str = "person_id",
+    exact_distinct: bool = True,
 ) -> DataFrame:
     """Generate a flowchart DataFrame summarising inclusion criteria effects.
 
@@ -142,6 +189,9 @@ def create_inclusion_flowchart(
             expressions.
         row_id_col (str): Column name for row IDs. Defaults to "row_id".
         person_id_col (str): Column name for person IDs. Defaults to "person_id".
+        exact_distinct (bool): Count distinct persons exactly. If False, counts are
+            approximated with HyperLogLog (about 2% relative error), which is much
+            cheaper on large cohorts. Defaults to True.
 
     Returns:
         DataFrame: Flowchart showing counts of rows and distinct persons passing each
@@ -150,71 +200,185 @@ def create_inclusion_flowchart(
     spark = get_spark_session()  # Get active Spark session
     criteria_columns = [f"criteria_{i}" for i in range(len(inclusion_criteria) + 1)]
 
-    # Create a DataFrame describing criteria with their names, descriptions, and exprs
-    df_inclusion_criteria = spark.createDataFrame(
-        [("criteria_0", "Original table", "")]
-        + [
-            (f"criteria_{i + 1}", k, v)
-            for i, (k, v) in enumerate(inclusion_criteria.items())
-        ],
-        ["criteria", "description", "expression"],
-    )
+    # Build criteria and person ID column references once for reuse in aggregations
+    criteria_cols = [F.col(c) for c in criteria_columns]
+    person_id = F.col(person_id_col)
+
+    # Describe criteria with their names, descriptions, and expressions
+    criteria_descriptions = [("Original table", "")] + list(inclusion_criteria.items())
+
+    # Coalesce cohorts estimated below the broadcast threshold into one partition, so
+    # the aggregation runs without a shuffle; estimates need JVM access, so skip
+    # this when it is unavailable
+    try:
+        plan_stats = cohort_flagged._jdf.queryExecution().optimizedPlan().stats()
+        sql_conf = spark._jsparkSession.sessionState().conf()
+        size_in_bytes = int(plan_stats.sizeInBytes())
+        is_small_cohort = size_in_bytes < int(sql_conf.autoBroadcastJoinThreshold())
+    except Exception:
+        is_small_cohort = False
+    if is_small_cohort:
+        cohort_flagged = cohort_flagged.coalesce(1)
+
+    # Count rows and distinct persons passing each criterion in aggregations over all
+    # criteria at once, avoiding an unpivot that would multiply the cohort rows
+    if exact_distinct:
+        # Pre-aggregate rows per person so distinct counts become counts of persons;
+        # partial aggregation collapses persons with many rows before the shuffle,
+        # avoiding skew and the row expansion of multiple distinct aggregates
+        person_counts = cohort_flagged.groupBy(person_id).agg(
+            *[
+                F.count(F.when(col, 1)).alias(c)
+                for c, col in zip(criteria_columns, criteria_cols, strict=True)
+            ]
+        )
+        has_person_id = person_id.isNotNull()
+        flowchart_counts = person_counts.agg(
+            *[
+                F.coalesce(F.sum(col), F.lit(0)).alias(f"n_row__{c}")
+                for c, col in zip(criteria_columns, criteria_cols, strict=True)
+            ],
+            *[
+                F.count(F.when(has_person_id & (col > 0), 1)).alias(
+                    f"n_distinct_id__{c}"
+                )
+                for c, col in zip(criteria_columns, criteria_cols, strict=True)
+            ],
+        ).collect()[0]
+    else:
+        # Approximate distinct persons with HyperLogLog in a single pass
+        flowchart_counts = cohort_flagged.agg(
+            *[
+                F.count(F.when(col, 1)).alias(f"n_row__{c}")
+                for c, col in zip(criteria_columns, criteria_cols, strict=True)
+            ],
+            *[
+                F.approx_count_distinct(F.when(col, person_id), rsd=0.02).alias(
+                    f"n_distinct_id__{c}"
+                )
+                for c, col in zip(criteria_columns, criteria_cols, strict=True)
+            ],
+        ).collect()[0]
+
+    # Combine counts with descriptions & expressions, calculating excluded rows and
+    # ids between criteria steps locally as the flowchart has only N+1 rows
+    flowchart_rows = []
+    previous_counts = None
+    for index, (c, (description, expression)) in enumerate(
+        zip(criteria_columns, criteria_descriptions, strict=True)
+    ):
+        n_row = flowchart_counts[f"n_row__{c}"]
+        n_distinct_id = flowchart_counts[f"n_distinct_id__{c}"]
+        if previous_counts is None:
+            excluded_rows, excluded_ids = None, None
+        else:
+            excluded_rows = previous_counts[0] - n_row
+            excluded_ids = previous_counts[1] - n_distinct_id
+        flowchart_rows.append(
+            (
+                index,
+                c,
+                description,
+                expression,
+                n_row,
+                n_distinct_id,
+                excluded_rows,
+                excluded_ids,
+            )
+        )
+        previous_counts = (n_row, n_distinct_id)
 
-    id_cols = [row_id_col, person_id_col]
-    flowchart_selected = cohort_flagged.select(id_cols + criteria_columns)
+    # Create flowchart DataFrame with final columns ordered by criteria index
+    flowchart_final = spark.createDataFrame(flowchart_rows, schema=_FLOWCHART_SCHEMA)
 
-    # Unpivot criteria columns to rows, with 'passed' bool per criterion per row
-    flowchart_unpivoted = flowchart_selected.unpivot(
-        ids=id_cols,
-        values=criteria_columns,
-        variableColumnName="criteria",
-        valueColumnName="passed",
-    )
+    return flowchart_final
 
-    # Count rows and distinct persons passing each criterion
-    flowchart_aggregated = flowchart_unpivoted.groupBy("criteria").agg(
-        F.count(F.when(F.col("passed"), 1)).alias("n_row"),
-        F.countDistinct(F.when(F.col("passed"), F.col(person_id_col))).alias(
-            "n_distinct_id"
-        ),
-    )
 
-    # Join with descriptions & expressions for criteria
-    flowchart_with_desc = flowchart_aggregated.join(
-        F.broadcast(df_inclusion_criteria), on="criteria", how="left"
-    )
+def parse_inclusion_criteria(inclusion_criteria: dict[str, str]) -> list[Column]:
+    """Parse inclusion criteria SQL expressions into null-safe boolean columns.
 
-    # Extract numeric index from criteria for ordering
-    flowchart_with_index = flowchart_with_desc.withColumn(
-        "criteria_index", F.regexp_extract("criteria", r"\d+", 0).cast("int")
-    )
+    Each expression is parsed once, and nulls are treated as not meeting the
+    criterion.
 
-    window_spec = Window.orderBy("criteria_index")  # Window for lag calculations
-
-    # Calculate excluded rows and ids between criteria steps
-    flowchart_difference = flowchart_with_index.withColumn(
-        "excluded_rows",
-        (F.lag("n_row", 1).over(window_spec) - F.col("n_row")).cast("int"),
-    ).withColumn(
-        "excluded_ids",
-        (F.lag("n_distinct_id", 1).over(window_spec) - F.col("n_distinct_id")).cast(
-            "int"
-        ),
-    )
+    Args:
+        inclusion_criteria (dict[str, str]): Mapping of column names to SQL expressions.
 
-    # Select final columns and order by criteria index
-    flowchart_final = flowchart_difference.select(
-        "criteria_index",
-        "criteria",
-        "description",
-        "expression",
-        "n_row",
-        "n_distinct_id",
-        "excluded_rows",
-        "excluded_ids",
-    ).orderBy("criteria_index")
+    Returns:
+        list[Column]: Boolean column per criterion, in criteria order.
+    """
+    false_literal = F.lit(False)
+    return [
+        F.coalesce(F.expr(sql_expression), false_literal)
+        for sql_expression in inclusion_criteria.values()
+    ]
 
-    return flowchart_final
+
+def balanced_and(columns: list[Column]) -> Column:
+    """Combine boolean columns with AND as a balanced expression tree.
+
+    Pairwise reduction keeps the expression depth logarithmic in the number of
+    columns, rather than linear as with a left fold, which keeps Catalyst analysis
+    and generated code shallow for many criteria. Columns are still evaluated in
+    their original order.
+
+    Args:
+        columns (list[Column]): Non-empty list of boolean columns.
+
+    Returns:
+        Column: Column that is True only if all columns are True.
+    """
+    while len(columns) > 1:
+        columns = [
+            columns[i] & columns[i + 1] if i + 1 < len(columns) else columns[i]
+            for i in range(0, len(columns), 2)
+        ]
+    return columns[0]
+
+
+def order_inclusion_criteria(
+    cohort: DataFrame, inclusion_criteria: dict[str, str], fraction: float = 0.01
+) -> dict[str, str]:
+    """Order inclusion criteria by their estimated pass rate, lowest first.
+
+    Pass rates for all criteria are estimated in a single aggregation over a random
+    sample of the cohort. Criteria without an estimate (e.g. for an empty sample)
+    keep their original relative order after the estimated criteria.
+
+    Args:
+        cohort (DataFrame): Input cohort DataFrame.
+        inclusion_criteria (dict[str, str]): Mapping of column names to SQL expressions.
+        fraction (float, optional): Fraction of rows to sample. Defaults to 0.01.
+
+    Returns:
+        dict[str, str]: Inclusion criteria ordered from most to least selective.
+    """
+    # Estimate the proportion of sampled rows meeting each criterion
+    pass_rates = (
+        cohort.sample(fraction=fraction)
+        .agg(
+            *[
+                F.avg(criteria_flag.cast("double")).alias(column_name)
+                for column_name, criteria_flag in zip(
+                    inclusion_criteria.keys(),
+                    parse_inclusion_criteria(inclusion_criteria),
+                    strict=True,
+                )
+            ]
+        )
+        .collect()[0]
+        .asDict()
+    )
+
+    # Sort criteria by pass rate, keeping criteria without an estimate last
+    return dict(
+        sorted(
+            inclusion_criteria.items(),
+            key=lambda item: (
+                pass_rates[item[0]] is None,
+                pass_rates[item[0]] or 0.0,
+            ),
+        )
+    )
 
 
 def validate_inclusion_criteria(
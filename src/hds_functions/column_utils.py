@@ -0,0 +1,27 @@
+"""Utilities for referencing Spark DataFrame columns.
+
+Functions:
+    - quoted_column: Reference a column by its exact name, quoting special characters.
+"""
+
+from pyspark.sql import Column
+from pyspark.sql import functions as F
+
+
+def quoted_column(name: str) -> Column:
+    """Reference a column by its exact name, quoting special characters.
+
+    Wraps the name in backticks so that names containing dots, spaces or
+    backticks are not parsed as nested field references.
+
+    Args:
+        name (str): Column name as it appears in DataFrame.columns.
+
+    Returns:
+        Column: Column referencing the named column.
+
+    Example:
+        >>> df.select(quoted_column("count.total"))
+    """
+    escaped_name = name.replace("`", "``")
+    return F.col(f"`{escaped_name}`")
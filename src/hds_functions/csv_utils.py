@@ -8,24 +8,54 @@ Functions:
 """
 
 import os
+from urllib.parse import urlparse
 
 import pandas as pd
 from pyspark.sql import DataFrame
 
 from .environment_utils import get_spark_session, resolve_path
 
+# Mapping of pd.read_csv() arguments to equivalent Spark CSV reader options
+_SPARK_CSV_OPTIONS = {
+    "sep": "sep",
+    "delimiter": "sep",
+    "encoding": "encoding",
+    "quotechar": "quote",
+    "escapechar": "escape",
+    "comment": "comment",
+}
+
 
 def read_csv_file(
-    path: str, repo: str = None, keep_default_na: bool = False, **kwargs
+    path: str,
+    repo: str = None,
+    keep_default_na: bool = False,
+    use_spark_reader: bool = False,
+    **kwargs,
 ) -> DataFrame:
     """Read a CSV file and return a Spark DataFrame.
 
+    By default the file is read with pd.read_csv() and converted to a Spark
+    DataFrame. Setting `use_spark_reader` reads it with Spark's native CSV reader
+    instead, so that parsing is distributed and the data never has to fit in
+    driver memory.
+
     Args:
         path (str): CSV file path (absolute, relative, or repo-relative).
         repo (str, optional): Repo name if path is repo-relative.
         keep_default_na (bool): Whether to include default NaN values.
             Defaults to False.
-        **kwargs: Additional args for pd.read_csv().
+        use_spark_reader (bool): Whether to read with Spark's CSV reader. Ignored,
+            falling back to pandas, when `keep_default_na` is True or any
+            pandas-only arguments are given. Defaults to False.
+        **kwargs: Additional args for pd.read_csv(). The Spark reader supports
+            `sep`, `delimiter`, `encoding`, `quotechar`, `escapechar` and `comment`.
+
+    Note:
+        The Spark reader does not give the same result as pandas. Column types are
+        inferred by Spark (e.g. int, double, date), whereas pandas gives long,
+        double and string columns, and empty fields are read as null, whereas
+        pandas with `keep_default_na=False` keeps them as empty strings.
 
     Returns:
         DataFrame: Spark DataFrame with the CSV data.
@@ -34,16 +64,36 @@ def read_csv_file(
         >>> read_csv_file('./relative/path/in/project.csv')
         >>> read_csv_file('/Workspace/absolute/path.csv')
         >>> read_csv_file(path='path/in/repo.csv', repo='common_repo')
+        >>> read_csv_file('/Workspace/absolute/large.csv', use_spark_reader=True)
     """
     # Resolve file path considering repo context
     resolved_path = resolve_path(path, repo)
 
-    # Read CSV into pandas DataFrame with optional NA handling
-    pandas_df = pd.read_csv(resolved_path, keep_default_na=keep_default_na, **kwargs)
-
-    # Get SparkSession and convert pandas DataFrame to Spark DataFrame
+    # Get SparkSession
     spark = get_spark_session()
-    spark_df = spark.createDataFrame(pandas_df)
+
+    # Read with pandas unless the Spark reader is requested and can handle the
+    # given options
+    if (
+        not use_spark_reader
+        or keep_default_na
+        or not set(kwargs).issubset(_SPARK_CSV_OPTIONS)
+    ):
+        pandas_df = pd.read_csv(
+            resolved_path, keep_default_na=keep_default_na, **kwargs
+        )
+        return spark.createDataFrame(pandas_df)
+
+    # Read CSV with Spark, mapping pandas arguments to Spark reader options
+    reader = spark.read.option("header", True).option("inferSchema", True)
+    for arg, value in kwargs.items():
+        reader = reader.option(_SPARK_CSV_OPTIONS[arg], value)
+
+    # Local files need an explicit scheme so Spark does not use the default filesystem
+    if urlparse(resolved_path).scheme == "":
+        resolved_path = f"file:{resolved_path}"
+
+    spark_df = reader.csv(resolved_path)
 
     return spark_df
 
@@ -66,6 +116,10 @@ def write_csv_file(
         max_rows_threshold (int): Max rows allowed before error. Defaults to 1000.
         **kwargs: Additional args for pd.DataFrame.to_csv().
 
+    Note:
+        Setting `spark.sql.execution.arrow.pyspark.enabled` to true speeds up the
+        conversion of the DataFrame to pandas.
+
     Raises:
         ValueError: If DataFrame is empty, too large, or dir missing.
         IOError: If writing the CSV fails.
@@ -75,8 +129,18 @@ def write_csv_file(
         >>> write_csv_file(spark_df, '/Workspace/absolute/path.csv')
         >>> write_csv_file(spark_df, path='path/in/repo.csv', repo='common_repo')
     """
-    # Count rows in the DataFrame
-    row_count = df.count()
+    # Resolve file path, considering repo-relative paths if applicable
+    resolved_path = resolve_path(path, repo)
+
+    # Ensure target directory exists before collecting any data
+    directory = os.path.dirname(resolved_path)
+    if not os.path.exists(directory):
+        raise ValueError(f"Directory '{directory}' does not exist.")
+
+    # Collect at most one row over the threshold, so the size check and conversion
+    # to pandas share a single Spark job and oversized inputs are not fully scanned
+    pandas_df = df.limit(max_rows_threshold + 1).toPandas()
+    row_count = len(pandas_df)
 
     # Raise error if DataFrame too large
     if row_count > max_rows_threshold:
@@ -85,21 +149,13 @@ def write_csv_file(
             "This function is for small datasets. Use save_table() for large datasets."
         )
 
-    # Resolve file path, considering repo-relative paths if applicable
-    resolved_path = resolve_path(path, repo)
-
-    # Ensure target directory exists before writing
-    directory = os.path.dirname(resolved_path)
-    if not os.path.exists(directory):
-        raise ValueError(f"Directory '{directory}' does not exist.")
-
     # Raise error if DataFrame is empty (nothing to write)
     if row_count == 0:
         raise ValueError("DataFrame is empty")
 
     try:
-        # Convert Spark DataFrame to Pandas DataFrame and write CSV
-        df.toPandas().to_csv(resolved_path, index=index, **kwargs)
+        # Write collected Pandas DataFrame to CSV
+        pandas_df.to_csv(resolved_path, index=index, **kwargs)
     except Exception as err:
         # Wrap and raise IOError on failure to write CSV
         raise IOError("Error writing DataFrame to CSV file") from err
@@ -125,6 +181,11 @@ def create_dict_from_csv(
             Defaults to True.
         repo (str, optional): Repo name if path is repo-relative. Defaults to None.
 
+    Note:
+        Keys and values keep the type of their own column. Rows mixing integer and
+        float columns are not cast to float, so an integer key of 1 gives '1'
+        rather than '1.0' and integer values stay integers.
+
     Returns:
         dict: Keys from key_column with values from value_columns.
 
@@ -155,23 +216,22 @@ def create_dict_from_csv(
     if not df[key_column].is_unique:
         raise ValueError("Key column '{}' is not unique".format(key_column))
 
-    result_dict = {}
-    # Iterate through each row in DataFrame
-    for _, row in df.iterrows():
-        # Cast key to string if requested
-        key = str(row[key_column]) if cast_key_as_string else row[key_column]
-
-        # Extract the values for the specified columns
-        values = {col: row[col] for col in value_columns}
-
-        # Simplify values if only one column specified
-        if len(value_columns) == 1:
-            values = next(iter(values.values()))
-        # Convert to list if not retaining column names in values dict
-        elif not retain_column_names:
-            values = list(values.values())
-
-        # Assign processed values to corresponding key in result dictionary
-        result_dict[key] = values
+    # Extract key and value columns once as Python lists, casting keys if requested
+    key_series = df[key_column].astype(str) if cast_key_as_string else df[key_column]
+    keys = key_series.tolist()
+    values = [df[col].tolist() for col in value_columns]
+
+    # Simplify values if only one column specified
+    if len(value_columns) == 1:
+        result_dict = dict(zip(keys, values[0], strict=True))
+    # Retain column names in a values dict per key
+    elif retain_column_names:
+        result_dict = {
+            key: dict(zip(value_columns, row, strict=True))
+            for key, row in zip(keys, zip(*values, strict=True), strict=True)
+        }
+    # Otherwise store values as a list per key
+    else:
+        result_dict = dict(zip(keys, map(list, zip(*values, strict=True)), strict=True))
 
     return result_dict
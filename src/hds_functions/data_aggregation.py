@@ -2,6 +2,12 @@
 
 Functions:
     - select_top_rows: Wrapper for first_dense_rank(), first_rank(), and first_row().
+    - select_first_row_per_partition: Returns the first row per partition without a
+        window.
+    - contains_map_type: Checks whether a data type contains a map, which cannot be
+        ordered.
+    - select_top_ranks_unpartitioned: Returns rows with the top N ranks without
+        partitioning.
     - first_row: Returns the first N rows per partition by sort order.
     - first_rank: Returns rows with the top N ranks per partition.
     - first_dense_rank: Returns rows with the top N dense ranks per partition.
@@ -10,6 +16,9 @@ Functions:
 
 from pyspark.sql import DataFrame, Window
 from pyspark.sql import functions as F
+from pyspark.sql.types import ArrayType, DataType, MapType, StructType
+
+from .column_utils import quoted_column
 
 
 def select_top_rows(
@@ -64,6 +73,31 @@ def select_top_rows(
     # Input validation for n
     assert isinstance(n, int) and n > 0, "n must be a positive, non-zero integer"
 
+    # Select the first row per partition with an aggregation instead of a window, when
+    # ordering ascending by column names that are not also partition columns, and no
+    # column is a map, which min() cannot order
+    if (
+        method == "row_number"
+        and n == 1
+        and partition_by is not None
+        and order_by
+        and all(isinstance(col, str) for col in [*partition_by, *order_by])
+        and not set(order_by) & set(partition_by)
+        and not any(contains_map_type(field.dataType) for field in df.schema)
+    ):
+        df_first = select_first_row_per_partition(df, partition_by, order_by)
+        if return_index_column:
+            df_first = df_first.withColumn(index_column_name, F.lit(1))
+        return df_first
+
+    # Without partitions, select rows with a distributed top-N instead of moving all
+    # rows to a single partition for the window
+    if partition_by is None and not return_index_column:
+        if method == "row_number":
+            return df.orderBy(*order_by).limit(n) if order_by else df.limit(n)
+        if order_by and all(isinstance(col, str) for col in order_by):
+            return select_top_ranks_unpartitioned(df, method, n, order_by)
+
     # Add '_dummy_column' if partition_by is not provided
     if partition_by is None:
         if "_dummy_column" in df.columns:
@@ -101,6 +135,98 @@ def select_top_rows(
     return df
 
 
+def select_first_row_per_partition(df, partition_by, order_by) -> DataFrame:
+    """Select the first row per partition, ordering ascending by column names.
+
+    Takes the minimum of a struct led by the ordering columns in a grouped
+    aggregation rather than a window. Struct minimums cannot be hash aggregated, so
+    Spark plans a partial and a final SortAggregate, each after a sort on the
+    partition columns only. The partial aggregation keeps one row per partition
+    before the shuffle, whereas a window shuffles every row and sorts it by the
+    ordering columns too. Nulls are ordered first, as in a window ordered ascending.
+    Columns are referenced by their exact names, so names containing dots are
+    supported, but no column may contain a map type.
+
+    Args:
+        df (DataFrame): PySpark DataFrame to process.
+        partition_by (list[str]): Columns to partition by.
+        order_by (list[str]): Column names to order by in ascending order.
+
+    Returns:
+        DataFrame: PySpark DataFrame with the first row per partition.
+    """
+    # Struct of ordering columns followed by the remaining non-partition columns
+    existing_columns = df.columns
+    key_columns = set(partition_by) | set(order_by)
+    other_columns = [col for col in existing_columns if col not in key_columns]
+    first_row_struct = F.struct(
+        *[quoted_column(col) for col in [*order_by, *other_columns]]
+    )
+
+    # Take the smallest struct per partition and restore the original columns
+    return (
+        df.groupBy(*[quoted_column(col) for col in partition_by])
+        .agg(F.min(first_row_struct).alias("_first_row"))
+        .select(*[quoted_column(col) for col in partition_by], "_first_row.*")
+        .select(*[quoted_column(col) for col in existing_columns])
+    )
+
+
+def contains_map_type(data_type: DataType) -> bool:
+    """Check whether a data type is, or contains, a map type.
+
+    Map values cannot be compared, so a struct containing one cannot be ordered.
+
+    Args:
+        data_type (DataType): Spark data type to check.
+
+    Returns:
+        bool: True if the type is a map or has a map in a nested struct or array.
+    """
+    if isinstance(data_type, MapType):
+        return True
+    if isinstance(data_type, StructType):
+        return any(contains_map_type(field.dataType) for field in data_type.fields)
+    if isinstance(data_type, ArrayType):
+        return contains_map_type(data_type.elementType)
+    return False
+
+
+def select_top_ranks_unpartitioned(df, method, n, order_by) -> DataFrame:
+    """Select rows with the top N ranks or dense ranks across the whole DataFrame.
+
+    A row has rank <= N exactly when its ordering key appears among the first N
+    ordered rows, and dense rank <= N when its key is among the first N distinct
+    ordered keys. The matching keys are semi-joined back to the DataFrame.
+
+    Args:
+        df (DataFrame): PySpark DataFrame to process.
+        method (str): Row indexing method: 'rank' or 'dense_rank'.
+        n (int): Number of ranks to retain.
+        order_by (list[str]): Column names to order by in ascending order.
+
+    Returns:
+        DataFrame: PySpark DataFrame with rows in the top N ranks.
+    """
+    # Find the ordering keys within the top N ranks
+    order_keys = df.select(*order_by)
+    if method == "rank":
+        top_keys = order_keys.orderBy(*order_by).limit(n).distinct()
+    else:
+        top_keys = order_keys.distinct().orderBy(*order_by).limit(n)
+
+    # Rename keys to avoid ambiguous self-join columns
+    top_keys = top_keys.select(
+        *[F.col(col).alias(f"_top_key_{i}") for i, col in enumerate(order_by)]
+    )
+
+    # Keep rows matching a top key, treating null keys as equal
+    join_condition = [
+        df[col].eqNullSafe(top_keys[f"_top_key_{i}"]) for i, col in enumerate(order_by)
+    ]
+    return df.join(F.broadcast(top_keys), on=join_condition, how="left_semi")
+
+
 def first_row(
     df,
     n=1,
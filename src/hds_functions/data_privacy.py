@@ -11,6 +11,8 @@ from pyspark.sql import DataFrame
 from pyspark.sql import functions as F
 from pyspark.sql.types import LongType
 
+from .column_utils import quoted_column
+
 
 def round_counts_to_multiple(
     df: DataFrame, columns: List[str], multiple: int = 5
@@ -28,7 +30,7 @@ def round_counts_to_multiple(
     Raises:
         TypeError: If df is not a DataFrame, columns is not a list of strings, or
             multiple is not an int.
-        ValueError: If columns do not exist or multiple is not positive.
+        ValueError: If any columns do not exist or multiple is not positive.
 
     Example:
         >>> df = spark.createDataFrame([(1, 7), (2, 17)], ["id", "count"])
@@ -55,18 +57,26 @@ def round_counts_to_multiple(
     if not isinstance(multiple, int) or multiple <= 0:
         raise ValueError("The 'multiple' argument must be a positive integer.")
 
+    # Nothing to transform, so return the DataFrame without a new plan
+    if not columns:
+        return df
+
     # Verify that all specified columns exist in the DataFrame
-    for col in columns:
-        if col not in df.columns:
-            raise ValueError(f"The column '{col}' does not exist in the DataFrame.")
-
-    # Round each specified column to the nearest multiple
-    for col in columns:
-        df = df.withColumn(
-            col, (F.round(F.col(col) / multiple) * multiple).cast(LongType())
+    existing_columns = set(df.columns)
+    missing_columns = [col for col in columns if col not in existing_columns]
+    if missing_columns:
+        raise ValueError(
+            "The following columns do not exist in the DataFrame: "
+            f"{', '.join(missing_columns)}"
         )
 
-    return df
+    # Round each specified column to the nearest multiple in a single projection
+    return df.withColumns(
+        {
+            col: (F.round(quoted_column(col) / multiple) * multiple).cast(LongType())
+            for col in columns
+        }
+    )
 
 
 def redact_low_counts(
@@ -117,20 +127,30 @@ def redact_low_counts(
     ):
         raise TypeError("Columns must be a list of strings.")
 
+    # Nothing to transform, so return the DataFrame without a new plan
+    if not columns:
+        return df
+
     # Check that all specified columns exist in the DataFrame
-    for col in columns:
-        if col not in df.columns:
-            raise ValueError(f"Column '{col}' does not exist in the DataFrame.")
+    existing_columns = set(df.columns)
+    missing_columns = [col for col in columns if col not in existing_columns]
+    if missing_columns:
+        raise ValueError(
+            "The following columns do not exist in the DataFrame: "
+            f"{', '.join(missing_columns)}"
+        )
 
     # Convert redaction value to a Spark literal for use in expressions
     redaction_value = (
         F.lit(redaction_value) if redaction_value is not None else F.lit(None)
     )
 
-    # Apply redaction: replace values below threshold with redaction_value
-    for col in columns:
-        df = df.withColumn(
-            col, F.when(F.col(col) >= threshold, F.col(col)).otherwise(redaction_value)
-        )
-
-    return df
+    # Apply redaction in a single projection: replace values below threshold
+    return df.withColumns(
+        {
+            col: F.when(quoted_column(col) >= threshold, quoted_column(col)).otherwise(
+                redaction_value
+            )
+            for col in columns
+        }
+    )
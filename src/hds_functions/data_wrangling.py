@@ -5,12 +5,17 @@ Functions:
     - map_column_values: Maps column values using a dictionary.
 """
 
+import re
+from collections import Counter
 from itertools import chain
 from typing import Dict
 
 import pyspark.sql.functions as F
 from pyspark.sql import DataFrame
 
+# Matches any character that is not alphanumeric or an underscore
+_INVALID_NAME_CHARS_RE = re.compile(r"\W")
+
 
 def clean_column_names(df: DataFrame) -> DataFrame:
     """Clean column names by replacing invalid characters and ensuring uniqueness.
@@ -37,25 +42,27 @@ def clean_column_names(df: DataFrame) -> DataFrame:
 
     def clean_name(name: str) -> str:
         # Replace non-alphanumeric characters with underscores
-        cleaned_name = "".join(c if c.isalnum() or c == "_" else "_" for c in name)
+        cleaned_name = _INVALID_NAME_CHARS_RE.sub("_", name)
         # Ensure column name doesn't start with a number
-        if cleaned_name[0].isdigit():
+        if cleaned_name[:1].isdigit():
             cleaned_name = "_" + cleaned_name
         return cleaned_name.lower()
 
-    # Clean column names
-    cleaned_columns = [clean_name(col) for col in df.columns]
+    # Clean column names, reading the existing names from the JVM only once
+    existing_columns = df.columns
+    cleaned_columns = [clean_name(col) for col in existing_columns]
 
     # Check for duplicate column names and make them unique
-    seen = {}
+    # The first occurrence keeps its name; later ones get suffixes _2, _3, ...
+    seen = Counter()
     new_columns = []
     for col in cleaned_columns:
-        if col not in seen:
-            seen[col] = 1
-            new_columns.append(col)
-        else:
-            seen[col] += 1
-            new_columns.append(f"{col}_{seen[col]}")
+        seen[col] += 1
+        new_columns.append(col if seen[col] == 1 else f"{col}_{seen[col]}")
+
+    # Return the DataFrame unchanged if every name is already clean
+    if new_columns == existing_columns:
+        return df
 
     # Rename columns in the DataFrame
     return df.toDF(*new_columns)
@@ -98,23 +105,25 @@ def map_column_values(
         +--------------+--------------+
     """
     # Check that the column to map exists in the DataFrame
-    if column not in df.columns:
+    existing_columns = set(df.columns)
+    if column not in existing_columns:
         raise ValueError(f"Column '{column}' does not exist in the DataFrame.")
 
     # Raise an error if the mapping dictionary is empty
     if not map_dict:
         raise ValueError("Empty mapping dictionary provided.")
 
-    # Convert the Python dictionary into a Spark map expression
-    # e.g., {'A': 'Apple'} -> create_map(lit('A'), lit('Apple'))
-    spark_map = F.create_map(*[F.lit(x) for x in chain(*map_dict.items())])
-
     # If a new column name is given, make sure it doesn't already exist
-    if new_column and new_column in df.columns:
+    if new_column and new_column in existing_columns:
         raise ValueError(f"Column '{new_column}' already exists in the DataFrame.")
 
     # Use new_column if provided, otherwise overwrite the original column
     new_col_name = new_column or column
 
+    # Convert the Python dictionary into a single Spark map literal, built only
+    # once validation has passed; the optimizer folds it into one constant
+    # e.g., {'A': 'Apple'} -> create_map(lit('A'), lit('Apple'))
+    spark_map = F.create_map(*map(F.lit, chain.from_iterable(map_dict.items())))
+
     # Create the new column by applying the Spark map to the original column
     return df.withColumn(new_col_name, spark_map[df[column]])
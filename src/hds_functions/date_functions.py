@@ -1,17 +1,45 @@
 """Module to parse and convert date instructions into PySpark SQL expressions.
 
 Provides utilities to parse date strings and relative date operations,
-validate date literals, and convert date units into day-based expressions
-compatible with PySpark.
+validate date literals, and convert date units into interval or day-based
+expressions compatible with PySpark.
 
 Functions:
     - parse_date_instruction: Parse date or relative operations to PySpark SQL.
+    - convert_date_units: Convert units added to or subtracted from dates to interval
+        literals, and other units to day counts.
     - convert_date_units_to_days: Convert relative units to day counts in expressions.
     - validate_date_string: Check if string is a valid 'YYYY-MM-DD' date.
+    - validate_date_strings: Check many strings at once for valid 'YYYY-MM-DD' dates.
 """
 
 import re
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterable, List
+
+import pandas as pd
+
+# Patterns compiled once at import rather than looked up on every call
+_DATE_LITERAL_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DATE_UNIT_RE = re.compile(r"day|week|month|year")
+_NUMBER_UNIT_RE = re.compile(r"\b(\d+(?:\.\d+)?)\s*(\w+)\b")
+# As _NUMBER_UNIT_RE, also capturing a binary + or - between an operand and the unit
+_OPERATOR_NUMBER_UNIT_RE = re.compile(
+    r"(?:(?<=[\w)\]'])(\s*[+-]\s*))?\b(\d+(?:\.\d+)?)\s*(\w+)\b"
+)
+
+# Number of days represented by each supported date unit
+_UNIT_TO_DAYS = {
+    "day": 1,
+    "days": 1,
+    "week": 7,
+    "weeks": 7,
+    "month": 30,
+    "months": 30,
+    "year": 365.25,
+    "years": 365.25,
+}
 
 
 def parse_date_instruction(date_string: str) -> str:
@@ -40,40 +68,38 @@ def parse_date_instruction(date_string: str) -> str:
         ValueError: Invalid date: '2020-02-30'
 
         >>> parse_date_instruction('index_date + 5 days')
-        "index_date + cast(round(5*1) as int)"
+        'index_date + INTERVAL 5 DAY'
 
         >>> parse_date_instruction('x - 6 weeks')
-        "x - cast(round(6*7) as int)"
+        'x - INTERVAL 42 DAY'
 
         >>> parse_date_instruction('index_date + 3 months')
-        "index_date + cast(round(3*30) as int)"
+        'index_date + INTERVAL 3 MONTH'
 
         >>> parse_date_instruction('index_date - 2 years')
-        "index_date - cast(round(2*365.25) as int)"
+        'index_date - INTERVAL 2 YEAR'
 
         >>> parse_date_instruction('index_date')
         'index_date'
 
         >>> parse_date_instruction('current_date() + 5 days')
-        'current_date() + cast(round(5*1) as int)'
+        'current_date() + INTERVAL 5 DAY'
     """
     # Check if date_string is None, if so return 'NULL'
     if date_string is None:
         return "cast(NULL as date)"
 
-    # Check if the instruction is a simple date string
-    elif re.match(r"\d{4}-\d{2}-\d{2}", date_string):
-        if validate_date_string(date_string):
-            return f"date('{date_string}')"
-        else:
-            raise ValueError(f"Invalid date: {date_string}")
+    # Check if the instruction is a simple date string, parsing it only once
+    elif date_string[:1].isdigit() and validate_date_string(date_string):
+        return f"date('{date_string}')"
+
+    # Raise for strings shaped like a date literal that are not real dates
+    elif _DATE_LITERAL_RE.match(date_string):
+        raise ValueError(f"Invalid date: {date_string}")
 
     # Check if the instruction is a transformation expression
-    elif any(
-        unit in date_string
-        for unit in ["day", "days", "week", "weeks", "month", "months", "year", "years"]
-    ):
-        parsed_expression = convert_date_units_to_days(date_string)
+    elif _DATE_UNIT_RE.search(date_string):
+        parsed_expression = convert_date_units(date_string)
         return parsed_expression
 
     # Otherwise return original date expression
@@ -81,6 +107,72 @@ def parse_date_instruction(date_string: str) -> str:
         return date_string
 
 
+def convert_date_units(date_expression: str) -> str:
+    """Convert date units in an expression to interval literals or day counts.
+
+    Extracts each numeric value and unit (day, week, month, year) from the input
+    expression. Where the unit is added to or subtracted from an operand, as in
+    'index_date + 3 months', it is replaced with a Spark SQL interval literal.
+    Whole numbers of years and months become calendar-aware ``INTERVAL n YEAR`` /
+    ``INTERVAL n MONTH`` literals, and days and weeks become ``INTERVAL n DAY``
+    with the day count rounded half up. Month and year counts that are not a whole
+    number of months fall back to a day interval using 30 days per month and
+    365.25 per year.
+
+    Any other unit, such as a function argument in 'date_add(x, 5 days)' or a
+    number compared in 'datediff(x, y) > 1 year', is converted to a day count as
+    in `convert_date_units_to_days`, since an interval is not valid there.
+
+    Args:
+        date_expression (str): Date or transformation expression, e.g.,
+            'index_date + 6 months' or 'x - 7.5 weeks'.
+
+    Returns:
+        str: Expression with units converted to interval literals or day counts.
+
+    Raises:
+        ValueError: If an unsupported unit is used.
+
+    Note:
+        A unit after a binary + or - is always treated as date arithmetic. Use
+        `convert_date_units_to_days` for purely numeric expressions such as
+        'datediff(x, y) - 30 days'.
+
+    Example:
+        >>> expr = 'index_date - 2 years, date_add(x, 7.5 weeks)'
+        >>> convert_date_units(expr)
+        'index_date - INTERVAL 2 YEAR, date_add(x, cast(round(7.5*7) as int))'
+    """
+
+    def convert_match(match: re.Match) -> str:
+        operator, number, unit = match.groups()
+        if operator is None:
+            return convert_date_units_to_days(match.group(0))
+        if unit not in _UNIT_TO_DAYS:
+            raise ValueError(
+                f"Invalid unit: {unit}. Use 'day', 'week', 'month', or 'year'."
+            )
+        value = Decimal(number)
+        unit = unit.rstrip("s")
+
+        # Whole years and months use calendar-aware year-month intervals
+        if unit == "year" and value % 1 == 0:
+            return f"{operator}INTERVAL {int(value)} YEAR"
+        if unit in ("month", "year"):
+            months = value * 12 if unit == "year" else value
+            if months % 1 == 0:
+                return f"{operator}INTERVAL {int(months)} MONTH"
+
+        # Otherwise convert to a whole number of days, rounding half up
+        days = (value * Decimal(str(_UNIT_TO_DAYS[unit]))).quantize(
+            Decimal(1), rounding=ROUND_HALF_UP
+        )
+        return f"{operator}INTERVAL {int(days)} DAY"
+
+    # Replace every "<number> <unit>" pattern in a single pass
+    return _OPERATOR_NUMBER_UNIT_RE.sub(convert_match, date_expression)
+
+
 def convert_date_units_to_days(date_expression: str) -> str:
     """Convert date units in an expression to days, rounding and casting to int.
 
@@ -96,40 +188,25 @@ def convert_date_units_to_days(date_expression: str) -> str:
     Returns:
         str: Expression with units converted to days and result cast to int.
 
+    Raises:
+        ValueError: If an unsupported unit is used.
+
     Example:
         >>> expr = 'index_date - 2 years, x - 7.5 weeks'
         >>> convert_date_units_to_days(expr)
         'index_date - cast(round(2*365.25) as int), x - cast(round(7.5*7) as int)'
     """
-    # Regex to find all "<number> <unit>" patterns
-    pattern = r"\b(\d+(?:\.\d+)?)\s*(\w+)\b"
-    matches = re.findall(pattern, date_expression)
-
-    unit_to_days = {
-        "day": 1,
-        "days": 1,
-        "week": 7,
-        "weeks": 7,
-        "month": 30,
-        "months": 30,
-        "year": 365.25,
-        "years": 365.25,
-    }
-
-    for number, unit in matches:
-        if unit not in unit_to_days:
+
+    def convert_match(match: re.Match) -> str:
+        number, unit = match.groups()
+        if unit not in _UNIT_TO_DAYS:
             raise ValueError(
                 f"Invalid unit: {unit}. Use 'day', 'week', 'month', or 'year'."
             )
+        return f"cast(round({number}*{_UNIT_TO_DAYS[unit]}) as int)"
 
-        converted_expression = f"cast(round({number}*{unit_to_days[unit]}) as int)"
-
-        # Replace original number + unit with converted expression
-        date_expression = re.sub(
-            rf"\b{number}\s*{unit}\b", converted_expression, date_expression
-        )
-
-    return date_expression
+    # Replace every "<number> <unit>" pattern in a single pass
+    return _NUMBER_UNIT_RE.sub(convert_match, date_expression)
 
 
 def validate_date_string(date_string: str) -> bool:
@@ -157,3 +234,32 @@ def validate_date_string(date_string: str) -> bool:
     # Parsing failed: invalid date or format
     except ValueError:
         return False
+
+
+def validate_date_strings(date_strings: Iterable[str]) -> List[bool]:
+    """Validate many strings as real dates in 'YYYY-MM-DD' format in one call.
+
+    Batch equivalent of `validate_date_string`. Strings are parsed together with
+    pandas' vectorised datetime parsing; only strings pandas cannot parse, such
+    as dates outside the pandas timestamp range (e.g. '9999-12-31'), are checked
+    individually.
+
+    Args:
+        date_strings (Iterable[str]): Date strings to validate.
+
+    Returns:
+        List[bool]: For each string, True if it is a valid date, else False.
+
+    Examples:
+        >>> validate_date_strings(['2020-01-01', '2020-02-30', '9999-12-31'])
+        [True, False, True]
+    """
+    # Parse all strings at once, marking unparseable values as NaT
+    date_series = pd.Series(list(date_strings), dtype="object")
+    is_valid = pd.to_datetime(date_series, format="%Y-%m-%d", errors="coerce").notna()
+
+    # Re-check strings pandas rejected, since its timestamps have a limited range
+    return [
+        valid or (isinstance(date_string, str) and validate_date_string(date_string))
+        for date_string, valid in zip(date_series, is_valid, strict=True)
+    ]
@@ -5,21 +5,32 @@ workspaces where notebook locations and relative paths can vary.
 
 Functions:
     - get_spark_session: Initialize and return a SparkSession.
+    - is_session_stopped: Check whether a Spark session has been stopped.
     - resolve_path: Construct paths relative to the project root.
     - find_project_folder: Recursively find project root by searching for a marker file.
 """
 
 import os
+from importlib.resources import files
 
-import pkg_resources
 from pyspark.sql import SparkSession
 
+# Spark session, and dbutils paired with the session it was created for,
+# reused across calls
+_SPARK_SESSION = None
+_DBUTILS = None
+
+# Project folders already found, keyed by notebook folder and marker file
+_PROJECT_FOLDER_CACHE = {}
+
 
 def get_spark_session():
     """Create or get an existing SparkSession.
 
     Initializes a SparkSession with a default app name if none exists,
-    otherwise returns the current active SparkSession.
+    otherwise returns the current active SparkSession. The session is cached at
+    module level and only looked up again once it has been stopped. The check reads
+    local attributes only, so a cache hit makes no JVM or server round trip.
 
     Returns:
         SparkSession: The active SparkSession object.
@@ -27,9 +38,32 @@ def get_spark_session():
     Example:
         >>> spark = get_spark_session()
     """
-    spark_session = SparkSession.builder.appName("SparkSession").getOrCreate()
+    global _SPARK_SESSION
+
+    # Reuse the cached session until it is stopped
+    if _SPARK_SESSION is None or is_session_stopped(_SPARK_SESSION):
+        _SPARK_SESSION = SparkSession.builder.appName("SparkSession").getOrCreate()
+
+    return _SPARK_SESSION
+
 
-    return spark_session
+def is_session_stopped(spark: SparkSession) -> bool:
+    """Check whether a Spark session has been stopped, without a JVM round trip.
+
+    Classic sessions clear the Java context of their SparkContext when stopped.
+    Spark Connect sessions have no SparkContext, and report closure through
+    `is_stopped` instead; reading `sparkContext` on them raises.
+
+    Args:
+        spark (SparkSession): Classic or Spark Connect session.
+
+    Returns:
+        bool: True if the session has been stopped.
+    """
+    spark_context = getattr(spark, "_sc", None)
+    if spark_context is not None:
+        return spark_context._jsc is None
+    return bool(getattr(spark, "is_stopped", False))
 
 
 def resolve_path(path: str, repo: str = None) -> str:
@@ -63,8 +97,8 @@ def resolve_path(path: str, repo: str = None) -> str:
         # Join project root with relative path (remove './' prefix)
         resolved_path = os.path.join(project_folder, path[2:])
     elif repo is not None:
-        # Use pkg_resources to get absolute path inside the specified repo
-        resolved_path = pkg_resources.resource_filename(repo, path)
+        # Use importlib.resources to get absolute path inside the specified repo
+        resolved_path = str(files(repo).joinpath(path))
     else:
         # Absolute path case, return as is
         resolved_path = path
@@ -75,6 +109,9 @@ def resolve_path(path: str, repo: str = None) -> str:
 def find_project_folder(marker_file=".dbxproj", workspace_prefix="/Workspace") -> str:
     """Locate project root by searching upward from the notebook path for a marker file.
 
+    The result is cached per notebook folder and marker file, so repeated calls
+    from the same notebook do not walk the directory tree again.
+
     Args:
         marker_file (str): Filename that identifies project root (default ".dbxproj").
         workspace_prefix (str): Root prefix of notebook path (default "/Workspace").
@@ -106,6 +143,11 @@ def find_project_folder(marker_file=".dbxproj", workspace_prefix="/Workspace") -
         f"{workspace_prefix}{os.path.dirname(context.notebookPath().get())}"
     )
 
+    # Reuse the project folder if it was already found for this notebook folder
+    cache_key = (notebook_folder, marker_file)
+    if cache_key in _PROJECT_FOLDER_CACHE:
+        return _PROJECT_FOLDER_CACHE[cache_key]
+
     current_path = notebook_folder  # Start search from the notebook's folder
 
     while True:
@@ -116,12 +158,11 @@ def find_project_folder(marker_file=".dbxproj", workspace_prefix="/Workspace") -
                 f"of {notebook_folder}."
             )
 
-        try:
-            # Check if marker file exists in current directory
-            if marker_file in os.listdir(current_path):
-                return current_path  # Found project root, return path
-        except (FileNotFoundError, PermissionError):
-            pass  # Skip inaccessible directories without stopping execution
+        # Check if marker file exists in current directory with a single stat;
+        # inaccessible directories are treated as not containing the marker
+        if os.path.exists(os.path.join(current_path, marker_file)):
+            _PROJECT_FOLDER_CACHE[cache_key] = current_path
+            return current_path  # Found project root, return path
 
         # Move up one directory level to continue the search
         current_path = os.path.dirname(current_path)
@@ -131,7 +172,8 @@ def get_dbutils(spark: SparkSession):
     """Get a DBUtils instance for Databricks notebook utilities.
 
     Tries to create DBUtils from the Spark session first; if unavailable,
-    falls back to retrieving `dbutils` from IPython user namespace.
+    falls back to retrieving `dbutils` from IPython user namespace. The instance
+    is cached and reused for subsequent calls with the same Spark session.
 
     Args:
         spark (SparkSession): Active Spark session.
@@ -148,19 +190,28 @@ def get_dbutils(spark: SparkSession):
         >>> ctx = dbutils.notebook.entry_point.getDbutils().notebook().getContext()
         >>> print(ctx.notebookPath().get())
     """
+    global _DBUTILS
+
+    # Reuse the cached dbutils if it was created for this Spark session
+    if _DBUTILS is not None and _DBUTILS[0] is spark:
+        return _DBUTILS[1]
+
     try:
         # Try importing DBUtils from pyspark (Databricks environment)
         from pyspark.dbutils import DBUtils
 
-        # Return a DBUtils instance using the active Spark session
-        return DBUtils(spark)
+        # Create a DBUtils instance using the active Spark session
+        dbutils = DBUtils(spark)
     except ImportError:
         try:
             # Fallback: import IPython to access notebook user namespace
             import IPython
 
-            # Return dbutils from IPython's user namespace if available
-            return IPython.get_ipython().user_ns["dbutils"]
+            # Get dbutils from IPython's user namespace if available
+            dbutils = IPython.get_ipython().user_ns["dbutils"]
         except (KeyError, AttributeError) as err:
             # Raise error if dbutils is not found in either approach
             raise RuntimeError("dbutils is not available in this environment.") from err
+
+    _DBUTILS = (spark, dbutils)
+    return dbutils
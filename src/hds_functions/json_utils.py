@@ -2,32 +2,104 @@
 
 import json
 import os
-from typing import Any, Dict
+from collections import Counter
+from typing import Any, Dict, Tuple
 
 from .environment_utils import resolve_path
 
+# orjson is optional: when installed it is used for the faster parse path
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def read_json_file(path: str, repo: str = None) -> Dict[str, Any]:
+# Duplicate-checked JSON text, keyed by path, modification time, size and whether
+# duplicates were checked, with the oldest entry evicted beyond the size limit
+_JSON_TEXT_CACHE = {}
+_JSON_TEXT_CACHE_SIZE = 128
+
+
+def read_json_file(
+    path: str, repo: str = None, check_duplicates: bool = True
+) -> Dict[str, Any]:
     """Read a JSON file and return its contents as a dictionary.
 
-    Loads a JSON file from the specified path (optionally within a repo) in binary mode,
-    checks for duplicate keys, and returns its contents as a Python dictionary.
+    Loads a JSON file from the specified path (optionally within a repo),
+    optionally checks for duplicate keys, and returns its contents as a Python
+    dictionary. The first read of a file parses it once, checking duplicates in
+    the same pass. The checked text is cached per path and modification time, so
+    repeated reads of an unchanged file skip the filesystem read and the
+    duplicate-key check. The optional ``orjson`` package is used to parse the
+    cached text when installed, falling back to the standard library for input it
+    rejects.
 
     Args:
         path (str): Path to the JSON file: absolute, relative ('./'), or within a repo.
         repo (str, optional): Repo name if using a repo-relative path.
+        check_duplicates (bool, optional): Whether to raise on duplicate keys.
+            If False, the last value of a duplicated key is kept. Defaults to True.
 
     Returns:
-        dict: Parsed JSON content.
+        dict: Parsed JSON content. A new dictionary is returned on every call.
 
     Raises:
-        ValueError: If the file contains duplicate keys.
+        ValueError: If check_duplicates is True and the file contains duplicate keys.
+
+    Note:
+        A file is only re-read when its modification time or size changes. A
+        rewrite that keeps the same size within the filesystem's timestamp
+        resolution, which can be a second or more on FUSE mounts such as
+        /Workspace or /dbfs, returns the previously cached content until the file
+        changes again.
 
     Examples:
         >>> read_json_file('./relative/path/in/project.json')
         >>> read_json_file('/Workspace/absolute/path.json')
         >>> read_json_file(path='path/in/repo.json', repo='common_repo')
     """
+    # Resolve the path
+    resolved_path = resolve_path(path, repo)
+
+    # Key the cache on the file's modification time and size so edits are picked up
+    file_stat = os.stat(resolved_path)
+    cache_key = (
+        resolved_path,
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        check_duplicates,
+    )
+
+    # Re-parse already-checked text on a cache hit, into a fresh dictionary
+    json_text = _JSON_TEXT_CACHE.get(cache_key)
+    if json_text is not None:
+        return parse_json_text(json_text)
+
+    # On a miss, read and parse the file once, returning the dictionary built by
+    # that parse and caching the text, evicting the oldest entry when full
+    json_text, json_dict = load_json_text(resolved_path, check_duplicates)
+    if len(_JSON_TEXT_CACHE) >= _JSON_TEXT_CACHE_SIZE:
+        _JSON_TEXT_CACHE.pop(next(iter(_JSON_TEXT_CACHE)))
+    _JSON_TEXT_CACHE[cache_key] = json_text
+
+    return json_dict
+
+
+def load_json_text(
+    resolved_path: str, check_duplicates: bool = True
+) -> Tuple[str, Dict[str, Any]]:
+    """Read a JSON file and parse it, optionally checking for duplicate keys.
+
+    Args:
+        resolved_path (str): Resolved path to the JSON file.
+        check_duplicates (bool, optional): Whether to check for duplicate keys.
+            Defaults to True.
+
+    Returns:
+        tuple[str, dict]: Contents of the JSON file and the parsed dictionary.
+
+    Raises:
+        ValueError: If check_duplicates is True and the file contains duplicate keys.
+    """
 
     def check_json_for_duplicate_keys(ordered_pairs):
         """Hook to detect duplicate keys while parsing a JSON object.
@@ -41,26 +113,46 @@ def read_json_file(path: str, repo: str = None) -> Dict[str, Any]:
         Raises:
             ValueError: If duplicate keys are found in the object.
         """
-        d = {}
-        for k, v in ordered_pairs:
-            if k in d:
-                raise ValueError(
-                    f"JSON file '{resolved_path}' contains duplicate key: {k}"
-                )
-            else:
-                d[k] = v
-        return d
-
-    # Resolve the path
-    resolved_path = resolve_path(path, repo)
-
-    # Load JSON file and check for duplicate keys
+        # Compare against a set of keys, only counting them if a duplicate exists
+        keys = [k for k, _ in ordered_pairs]
+        if len(keys) != len(set(keys)):
+            duplicate_key = next(k for k, n in Counter(keys).items() if n > 1)
+            raise ValueError(
+                f"JSON file '{resolved_path}' contains duplicate key: {duplicate_key}"
+            )
+        return dict(ordered_pairs)
+
+    # Load JSON file, checking for duplicate keys in the same parse if requested
     with open(resolved_path) as json_file:
-        json_dict = json.load(
-            json_file, object_pairs_hook=check_json_for_duplicate_keys
+        json_text = json_file.read()
+    if check_duplicates:
+        json_dict = json.loads(
+            json_text, object_pairs_hook=check_json_for_duplicate_keys
         )
+    else:
+        json_dict = json.loads(json_text)
 
-    return json_dict
+    return json_text, json_dict
+
+
+def parse_json_text(json_text: str) -> Dict[str, Any]:
+    """Parse JSON text, using orjson when installed.
+
+    orjson rejects some input the standard library accepts, such as NaN or
+    integers beyond 64 bits, so such text is parsed with json.loads instead.
+
+    Args:
+        json_text (str): JSON text to parse.
+
+    Returns:
+        dict: Parsed JSON content.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_text)
 
 
 def write_json_file(
@@ -68,14 +160,16 @@ def write_json_file(
 ) -> None:
     """Write a dictionary to a JSON file at the given path.
 
-    Saves the dictionary as a formatted JSON file, optionally within a repo, using
-    the specified indentation for readability.
+    Saves the dictionary as a JSON file, optionally within a repo. Passing
+    `indent=None` writes compact JSON, which lets the C encoder serialise the
+    whole document in one pass.
 
     Args:
         data (dict): Dictionary to write.
         path (str): File path (absolute, relative, or within a repo).
         repo (str, optional): Repo name if using a repo-relative path.
-        indent (int, optional): Number of spaces for indentation. Defaults to 4.
+        indent (int, optional): Number of spaces for indentation, or None for
+            compact JSON. Defaults to 4.
 
     Returns:
         None
@@ -85,6 +179,7 @@ def write_json_file(
         >>> write_json_file(data, "./in_project_folder.json")
         >>> write_json_file(data, "/Workspace/absolute_path.json")
         >>> write_json_file(data, path="in/shared/repo.json", repo="common_repo")
+        >>> write_json_file(data, "./compact.json", indent=None)
     """
     # Resolve the path
     resolved_path = resolve_path(path, repo)
@@ -94,6 +189,7 @@ def write_json_file(
     if not os.path.exists(directory):
         raise ValueError(f"Directory '{directory}' does not exist.")
 
-    # Write file
+    # Serialise in one call and write once, rather than streaming json.dump
+    # chunks, which always uses the pure-Python encoder
     with open(resolved_path, "w") as fp:
-        json.dump(data, fp, indent=indent)
+        fp.write(json.dumps(data, indent=indent))
@@ -0,0 +1,41 @@
+"""Shared pytest fixtures for the hds_functions test suite.
+
+The suite runs in a single process by default, which keeps one JVM for the
+whole session. Parallel runs across test files are opt-in with pytest-xdist:
+
+    pytest -n 3 --dist loadfile
+
+Each worker then starts its own SparkSession (about 1 GB of heap each) and runs
+whole test files, trading extra memory for shorter wall time.
+"""
+
+import pytest
+from pyspark.sql import SparkSession
+
+
+@pytest.fixture(scope="session")
+def spark():
+    """Create a single SparkSession shared by every test module.
+
+    The session is tuned for tiny local DataFrames: one shuffle partition, no
+    adaptive query execution, no UI, an in-memory catalog and a small JVM heap.
+    Arrow is enabled for pandas conversions, falling back to the row-based path
+    when a type is unsupported. It is stopped once the test session finishes.
+    """
+    session = (
+        SparkSession.builder.master("local[1]")
+        .appName("hds-tests")
+        .config("spark.driver.memory", "1g")
+        .config("spark.executor.memory", "1g")
+        .config("spark.sql.shuffle.partitions", "1")
+        .config("spark.default.parallelism", "1")
+        .config("spark.sql.adaptive.enabled", "false")
+        .config("spark.ui.enabled", "false")
+        .config("spark.ui.showConsoleProgress", "false")
+        .config("spark.sql.catalogImplementation", "in-memory")
+        .config("spark.sql.execution.arrow.pyspark.enabled", "true")
+        .config("spark.sql.execution.arrow.pyspark.fallback.enabled", "true")
+        .getOrCreate()
+    )
+    yield session
+    session.stop()
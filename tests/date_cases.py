@@ -0,0 +1,49 @@
+"""Date test cases shared by the date_functions test modules.
+
+This is a plain module rather than a test module, so the pure-Python and Spark
+date tests can import the same case tables without pytest collecting it.
+"""
+
+# Date instructions, their parsed expressions and the resulting date for an
+# index_date of 2020-01-01, shared by the parsing and Spark evaluation tests
+DATE_CASES = [
+    ("2020-01-01", "date('2020-01-01')", "2020-01-01"),
+    ("2020-1-1", "date('2020-1-1')", "2020-01-01"),
+    ("index_date + 5 days", "index_date + INTERVAL 5 DAY", "2020-01-06"),
+    ("index_date - 6 weeks", "index_date - INTERVAL 42 DAY", "2019-11-20"),
+    ("index_date + 3 months", "index_date + INTERVAL 3 MONTH", "2020-04-01"),
+    ("index_date - 2 years", "index_date - INTERVAL 2 YEAR", "2018-01-01"),
+    ("index_date + 1.5 years", "index_date + INTERVAL 18 MONTH", "2021-07-01"),
+    ("index_date + 7.5 weeks", "index_date + INTERVAL 53 DAY", "2020-02-23"),
+    # Units passed as a function argument or compared as numbers become day counts
+    (
+        "date_add(index_date, 5 days)",
+        "date_add(index_date, cast(round(5*1) as int))",
+        "2020-01-06",
+    ),
+    (
+        "if(datediff(index_date + 400 days, index_date) > 1 year, "
+        "index_date + 1 month, index_date)",
+        "if(datediff(index_date + INTERVAL 400 DAY, index_date) > "
+        "cast(round(1*365.25) as int), index_date + INTERVAL 1 MONTH, index_date)",
+        "2020-02-01",
+    ),
+    ("index_date", "index_date", "2020-01-01"),
+    (None, "cast(NULL as date)", None),
+]
+
+
+# Date strings and whether each is a valid 'YYYY-MM-DD' date
+DATE_STRING_CASES = [
+    ("2020-01-01", True),  # Valid normal date
+    ("2020-02-30", False),  # Invalid date (Feb 30 does not exist)
+    ("2019-02-28", True),  # Valid non-leap year Feb end date
+    ("2019-02-29", False),  # Invalid non-leap year Feb 29
+    ("2020-02-29", True),  # Valid leap year Feb 29
+    ("", False),  # Empty string is invalid
+    ("2020-13-01", False),  # Invalid month (13 does not exist)
+    ("2020-00-10", False),  # Invalid month zero
+    ("2020-01-00", False),  # Invalid day zero
+    ("not-a-date", False),  # Non-date string
+    ("9999-12-31", True),  # Valid date beyond the pandas timestamp range
+]
@@ -0,0 +1,28 @@
+"""DataFrame assertions shared by the test modules.
+
+This is a plain module rather than a test module or fixture, so test modules
+import the assertion directly without pytest collecting it.
+"""
+
+
+def assert_small_df_equal(actual, expected, check_row_order=False):
+    """Assert two small DataFrames have equal schemas and rows.
+
+    Collects both DataFrames to the driver and compares the rows in Python,
+    which is much cheaper than assertDataFrameEqual for DataFrames of a few
+    rows. Only use it for small test DataFrames.
+
+    Args:
+        actual (DataFrame): DataFrame produced by the code under test.
+        expected (DataFrame): Expected DataFrame.
+        check_row_order (bool, optional): Whether row order must match.
+            Defaults to False.
+    """
+    assert actual.schema == expected.schema, (
+        f"Schemas differ:\n{actual.schema}\n{expected.schema}"
+    )
+    actual_rows, expected_rows = actual.collect(), expected.collect()
+    if not check_row_order:
+        actual_rows = sorted(actual_rows, key=str)
+        expected_rows = sorted(expected_rows, key=str)
+    assert actual_rows == expected_rows
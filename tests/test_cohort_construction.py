@@ -0,0 +1,250 @@
+"""Unit tests for cohort_construction.py.
+
+These tests validate the correctness of cohort filtering and flowchart utilities,
+including:
+    - apply_inclusion_criteria: Filters a cohort, optionally saving a flowchart
+    - create_inclusion_columns: Adds criteria flag and cumulative columns
+    - create_inclusion_flowchart: Counts rows and persons passing each criterion
+    - order_inclusion_criteria: Orders criteria from most to least selective
+
+Edge cases tested:
+    - Null person IDs and null criteria results
+    - Direct filtering matching the flagged path
+    - Approximate distinct person counts
+    - Flowchart column types, including counts beyond the 32-bit range
+    - Criteria ordering, including empty criteria
+    - Many criteria, which must not inline the cumulative chain
+    - Criteria skipped on rows that failed an earlier criterion
+
+Flowcharts are captured by replacing save_table, so no table is written.
+"""
+
+import pytest
+from pyspark.sql.types import LongType, StringType, StructField, StructType
+
+from hds_functions import cohort_construction
+from hds_functions.cohort_construction import (
+    apply_inclusion_criteria,
+    create_inclusion_columns,
+    create_inclusion_flowchart,
+    order_inclusion_criteria,
+)
+
+# Explicit cohort schema, avoiding schema inference
+COHORT_SCHEMA = StructType(
+    [
+        StructField("row_id", LongType(), True),
+        StructField("person_id", StringType(), True),
+        StructField("age", LongType(), True),
+    ]
+)
+
+# Cohort rows with repeated persons, a null person ID and a null age
+COHORT_DATA = [
+    (1, "a", 30),
+    (2, "a", 70),
+    (3, None, 40),
+    (4, "b", None),
+    (5, "c", 20),
+    (6, "c", 50),
+]
+
+INCLUSION_CRITERIA = {
+    "valid_id": "person_id IS NOT NULL",
+    "age_ok": "age < 65",
+    "young": "age < 45",
+}
+
+# Expected flowchart rows for COHORT_DATA and INCLUSION_CRITERIA; persons with a
+# null ID are counted as rows but not as distinct persons
+FLOWCHART_ROWS = [
+    (0, "criteria_0", "Original table", "", 6, 3, None, None),
+    (1, "criteria_1", "valid_id", "person_id IS NOT NULL", 5, 3, 1, 0),
+    (2, "criteria_2", "age_ok", "age < 65", 3, 2, 2, 1),
+    (3, "criteria_3", "young", "age < 45", 2, 2, 1, 0),
+]
+
+# Expected flowchart column types, with counts and exclusions as longs
+FLOWCHART_DTYPES = [
+    ("criteria_index", "int"),
+    ("criteria", "string"),
+    ("description", "string"),
+    ("expression", "string"),
+    ("n_row", "bigint"),
+    ("n_distinct_id", "bigint"),
+    ("excluded_rows", "bigint"),
+    ("excluded_ids", "bigint"),
+]
+
+# Rows meeting all of INCLUSION_CRITERIA
+INCLUDED_ROWS = [(1, "a", 30), (5, "c", 20)]
+
+
+@pytest.fixture(scope="session")
+def cohort(spark):
+    """Cached cohort DataFrame shared across tests."""
+    return spark.createDataFrame(COHORT_DATA, schema=COHORT_SCHEMA).cache()
+
+
+@pytest.fixture
+def saved_tables(monkeypatch):
+    """Capture DataFrames passed to save_table, keyed by table name."""
+    tables = {}
+    monkeypatch.setattr(
+        cohort_construction,
+        "save_table",
+        lambda df, table: tables.__setitem__(table, df),
+    )
+    return tables
+
+
+def test_create_inclusion_columns(cohort):
+    """Test flag, cumulative criteria and include columns, with nulls as False."""
+    result = create_inclusion_columns(cohort, INCLUSION_CRITERIA)
+
+    assert result.columns == [
+        *cohort.columns,
+        "valid_id",
+        "age_ok",
+        "young",
+        "criteria_0",
+        "criteria_1",
+        "criteria_2",
+        "criteria_3",
+        "include",
+    ]
+    rows = {row["row_id"]: row for row in result.collect()}
+    assert tuple(rows[3])[3:] == (False, True, True, True, False, False, False, False)
+    assert tuple(rows[4])[3:] == (True, False, False, True, True, False, False, False)
+    assert sorted(row_id for row_id, row in rows.items() if row["include"]) == [1, 5]
+
+
+@pytest.mark.parametrize("exact_distinct", [True, False], ids=["exact", "approx"])
+def test_create_inclusion_flowchart(cohort, exact_distinct):
+    """Test flowchart counts, with exact and approximate distinct person counts."""
+    cohort_flagged = create_inclusion_columns(cohort, INCLUSION_CRITERIA)
+    flowchart = create_inclusion_flowchart(
+        cohort_flagged, INCLUSION_CRITERIA, exact_distinct=exact_distinct
+    )
+
+    assert flowchart.dtypes == FLOWCHART_DTYPES
+    assert flowchart.collect() == FLOWCHART_ROWS
+
+
+def test_flowchart_schema_holds_large_counts(spark):
+    """Test that counts and exclusions beyond the 32-bit range fit the schema."""
+    large_count = 3_000_000_000
+    row = (1, "criteria_1", "valid_id", "x", 0, 0, large_count, large_count)
+
+    flowchart = spark.createDataFrame(
+        [row], schema=cohort_construction._FLOWCHART_SCHEMA
+    )
+
+    assert flowchart.collect() == [row]
+
+
+def test_apply_inclusion_criteria_saves_flowchart(cohort, saved_tables):
+    """Test that the flowchart is saved and the filtered cohort returned."""
+    result = apply_inclusion_criteria(
+        cohort, INCLUSION_CRITERIA, flowchart_table="flowchart"
+    )
+
+    assert result.columns == cohort.columns
+    assert sorted(result.collect()) == INCLUDED_ROWS
+    assert saved_tables["flowchart"].dtypes == FLOWCHART_DTYPES
+    assert saved_tables["flowchart"].collect() == FLOWCHART_ROWS
+
+
+def test_many_criteria_flowchart(cohort):
+    """Test that many criteria build a flowchart and flags without blowing up plans.
+
+    Each cumulative criteria column reads the previous one, so generated code stays
+    small; inlining the whole chain into every column exhausted driver memory
+    with around 30 criteria.
+    """
+    many_criteria = {
+        f"age_over_{i}": f"age > {i} OR person_id IS NULL" for i in range(30)
+    }
+    cohort_flagged = create_inclusion_columns(cohort, many_criteria)
+    flowchart = create_inclusion_flowchart(cohort_flagged, many_criteria).collect()
+    included = sorted(
+        apply_inclusion_criteria(
+            cohort, many_criteria, drop_inclusion_flags=False
+        ).collect()
+    )
+
+    assert len(flowchart) == len(many_criteria) + 1
+    assert [row["n_row"] for row in flowchart[20:22]] == [5, 4]
+    assert flowchart[-1]["n_row"] == 4
+    assert [row["row_id"] for row in included] == [1, 2, 3, 6]
+    assert all(row["include"] for row in included)
+
+
+def test_criteria_skipped_after_failed_criterion(cohort):
+    """Test that a criterion is not evaluated on rows failing an earlier one.
+
+    The second criterion raises for any row aged 45 or over, or with a null age,
+    so evaluating it on every row would fail the query.
+    """
+    guarded_criteria = {
+        "young": "age < 45",
+        "checked": "assert_true(age < 45) IS NULL",
+    }
+    cohort_flagged = create_inclusion_columns(cohort, guarded_criteria)
+    flowchart = create_inclusion_flowchart(cohort_flagged, guarded_criteria)
+    included = apply_inclusion_criteria(cohort, guarded_criteria)
+
+    assert [row["n_row"] for row in flowchart.collect()] == [6, 3, 3]
+    assert sorted(row["row_id"] for row in included.collect()) == [1, 3, 5]
+
+
+def test_apply_inclusion_criteria_direct_filter_matches_flagged(cohort):
+    """Test that direct filtering returns the same rows as the flagged path."""
+    direct = apply_inclusion_criteria(cohort, INCLUSION_CRITERIA)
+    flagged = apply_inclusion_criteria(
+        cohort, INCLUSION_CRITERIA, drop_inclusion_flags=False
+    )
+
+    assert direct.columns == cohort.columns
+    assert sorted(direct.collect()) == INCLUDED_ROWS
+    assert sorted(flagged.select(*cohort.columns).collect()) == INCLUDED_ROWS
+    assert all(row["include"] for row in flagged.collect())
+
+
+def test_apply_inclusion_criteria_empty_criteria(cohort):
+    """Test that empty criteria return every row on each path."""
+    assert apply_inclusion_criteria(cohort, {}) is cohort
+    assert apply_inclusion_criteria(cohort, {}, order_criteria=True) is cohort
+    flagged = apply_inclusion_criteria(cohort, {}, drop_inclusion_flags=False)
+    assert flagged.count() == len(COHORT_DATA)
+
+
+def test_order_inclusion_criteria(cohort):
+    """Test that criteria are ordered from lowest to highest pass rate."""
+    ordered = order_inclusion_criteria(cohort, INCLUSION_CRITERIA, fraction=1.0)
+
+    assert list(ordered) == ["young", "age_ok", "valid_id"]
+    assert ordered == INCLUSION_CRITERIA
+
+
+def test_apply_inclusion_criteria_ordered(cohort, saved_tables):
+    """Test that ordering criteria keeps the filtered rows and reorders steps."""
+    result = apply_inclusion_criteria(
+        cohort,
+        INCLUSION_CRITERIA,
+        flowchart_table="flowchart",
+        order_criteria=True,
+    )
+
+    assert sorted(result.collect()) == INCLUDED_ROWS
+    flowchart = saved_tables["flowchart"].collect()
+    assert sorted(row["description"] for row in flowchart[1:]) == sorted(
+        INCLUSION_CRITERIA
+    )
+    assert flowchart[-1]["n_row"] == len(INCLUDED_ROWS)
+
+
+def test_apply_inclusion_criteria_conflicting_columns(cohort):
+    """Test that cohort columns clashing with criteria names raise ValueError."""
+    with pytest.raises(ValueError, match="conflicting columns: age"):
+        apply_inclusion_criteria(cohort, {"age": "age > 0"})
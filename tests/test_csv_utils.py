@@ -0,0 +1,192 @@
+"""Unit tests for csv_utils.py.
+
+These tests validate reading CSV files into Spark DataFrames, including:
+    - read_csv_file: Reads a CSV with pandas or, on request, Spark's CSV reader
+    - write_csv_file: Writes a small Spark DataFrame to a CSV
+    - create_dict_from_csv: Builds a dict from key and value columns of a CSV
+
+Edge cases tested:
+    - Empty cells, integers and dates on the pandas and Spark reader paths
+    - Falling back to pandas for options the Spark reader cannot replicate
+    - Round trip of integers, floats, nulls and timestamps through a CSV
+    - Index and pandas writing options, and the row threshold
+    - Mixed integer and float columns keeping their own types in a dict
+    - Duplicate keys
+
+CSV fixtures are written to pytest's tmp_path and read by absolute path.
+"""
+
+import datetime
+
+import pytest
+from pyspark.sql.types import (
+    DoubleType,
+    LongType,
+    StringType,
+    StructField,
+    StructType,
+    TimestampType,
+)
+
+from hds_functions.csv_utils import (
+    create_dict_from_csv,
+    read_csv_file,
+    write_csv_file,
+)
+
+# CSV with integer, date, string and float columns, each with an empty cell
+CSV_TEXT = "code,start,name,score\n1,2020-01-01,a,1.5\n2,2020-02-03,,2.0\n3,,c,\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """Write CSV_TEXT to a temporary file and return its absolute path."""
+    path = tmp_path / "data.csv"
+    path.write_text(CSV_TEXT)
+    return str(path)
+
+
+def test_read_csv_file_pandas_default(spark, csv_path):
+    """Test that the default path keeps pandas types and empty strings."""
+    result = read_csv_file(csv_path)
+
+    assert result.dtypes == [
+        ("code", "bigint"),
+        ("start", "string"),
+        ("name", "string"),
+        ("score", "string"),
+    ]
+    assert result.collect() == [
+        (1, "2020-01-01", "a", "1.5"),
+        (2, "2020-02-03", "", "2.0"),
+        (3, "", "c", ""),
+    ]
+
+
+def test_read_csv_file_spark_reader(spark, csv_path):
+    """Test that the Spark reader infers types and reads empty cells as null."""
+    result = read_csv_file(csv_path, use_spark_reader=True)
+    pandas_result = read_csv_file(csv_path)
+
+    assert result.columns == pandas_result.columns
+    assert result.dtypes == [
+        ("code", "int"),
+        ("start", "date"),
+        ("name", "string"),
+        ("score", "double"),
+    ]
+    assert result.collect() == [
+        (1, datetime.date(2020, 1, 1), "a", 1.5),
+        (2, datetime.date(2020, 2, 3), None, 2.0),
+        (3, None, "c", None),
+    ]
+
+
+def test_read_csv_file_spark_reader_falls_back_to_pandas(spark, csv_path):
+    """Test that pandas-only options fall back to the pandas path."""
+    result = read_csv_file(csv_path, use_spark_reader=True, usecols=["code", "name"])
+
+    assert result.dtypes == [("code", "bigint"), ("name", "string")]
+    assert result.collect() == [(1, "a"), (2, ""), (3, "c")]
+
+
+# Explicit schema for written DataFrames, avoiding schema inference
+WRITE_SCHEMA = StructType(
+    [
+        StructField("code", LongType(), True),
+        StructField("score", DoubleType(), True),
+        StructField("name", StringType(), True),
+        StructField("seen", TimestampType(), True),
+    ]
+)
+
+WRITE_DATA = [
+    (1, 1.5, "a", datetime.datetime(2020, 1, 1, 9, 30, 0, 120000)),
+    (2, None, None, datetime.datetime(2020, 2, 3)),
+]
+
+
+def test_write_csv_file_round_trip(spark, tmp_path):
+    """Test that written rows match pandas formatting and read back unchanged."""
+    df = spark.createDataFrame(WRITE_DATA, schema=WRITE_SCHEMA)
+    path = str(tmp_path / "written.csv")
+
+    write_csv_file(df, path)
+
+    with open(path) as csv_file:
+        assert csv_file.read() == df.toPandas().to_csv(index=False)
+    result = read_csv_file(path, keep_default_na=True)
+    assert result.select("code", "name").collect() == [(1, "a"), (2, None)]
+    assert result.select("score").collect()[0] == (1.5,)
+    assert [row["seen"] for row in result.collect()] == [
+        "2020-01-01 09:30:00.120",
+        "2020-02-03 00:00:00.000",
+    ]
+
+
+def test_write_csv_file_pandas_options(spark, tmp_path):
+    """Test that index and to_csv arguments are passed to pandas."""
+    df = spark.createDataFrame(WRITE_DATA, schema=WRITE_SCHEMA).select("code")
+    path = str(tmp_path / "written.csv")
+
+    write_csv_file(df, path, index=True, sep=";")
+
+    with open(path) as csv_file:
+        assert csv_file.read().splitlines() == [";code", "0;1", "1;2"]
+
+
+@pytest.mark.parametrize(
+    "max_rows_threshold,message",
+    [
+        pytest.param(1, "exceeds maximum rows threshold of 1", id="too_large"),
+        pytest.param(0, "exceeds maximum rows threshold of 0", id="zero_threshold"),
+    ],
+)
+def test_write_csv_file_threshold(spark, tmp_path, max_rows_threshold, message):
+    """Test that DataFrames over the row threshold raise ValueError."""
+    df = spark.createDataFrame(WRITE_DATA, schema=WRITE_SCHEMA)
+
+    with pytest.raises(ValueError, match=message):
+        write_csv_file(
+            df, str(tmp_path / "written.csv"), max_rows_threshold=max_rows_threshold
+        )
+    assert not (tmp_path / "written.csv").exists()
+
+
+@pytest.mark.parametrize(
+    "value_columns,retain_column_names,expected",
+    [
+        pytest.param("count", False, {"1": 5, "2": 7}),
+        pytest.param(["count", "rate"], False, {"1": [5, 0.5], "2": [7, 1.0]}),
+        pytest.param(
+            ["count", "rate"],
+            True,
+            {"1": {"count": 5, "rate": 0.5}, "2": {"count": 7, "rate": 1.0}},
+        ),
+    ],
+    ids=["single", "list", "named"],
+)
+def test_create_dict_from_csv_mixed_types(
+    tmp_path, value_columns, retain_column_names, expected
+):
+    """Test that integer and float columns keep their own types in the dict."""
+    path = tmp_path / "mixed.csv"
+    path.write_text("id,count,rate\n1,5,0.5\n2,7,1.0\n")
+
+    result = create_dict_from_csv(
+        str(path), "id", value_columns, retain_column_names=retain_column_names
+    )
+
+    assert result == expected
+    assert all(type(key) is str for key in result)
+    if isinstance(value_columns, list) and not retain_column_names:
+        assert [type(value) for value in result["1"]] == [int, float]
+
+
+def test_create_dict_from_csv_duplicate_keys(tmp_path):
+    """Test that a key column with duplicates raises ValueError."""
+    path = tmp_path / "duplicates.csv"
+    path.write_text("id,count\n1,5\n1,7\n")
+
+    with pytest.raises(ValueError, match="Key column 'id' is not unique"):
+        create_dict_from_csv(str(path), "id", "count")
@@ -7,7 +7,7 @@ These tests validate the correctness of row-selection utilities including:
 
 Edge cases tested:
     - Handling of NULL values
-    - Global (unpartitioned) top-N selection
+    - Global (unpartitioned) top-N selection, including ranks with ties
     - Index column inclusion
     - Ties in rank and dense_rank
     - Input validation and error handling
@@ -16,8 +16,8 @@ PySpark's assertDataFrameEqual is used to ensure accurate DataFrame comparison.
 """
 
 import pytest
-from pyspark.sql import SparkSession
 from pyspark.sql import functions as F
+from pyspark.sql.types import IntegerType, StringType, StructField, StructType
 from pyspark.testing import assertDataFrameEqual
 
 from hds_functions.data_aggregation import (
@@ -27,85 +27,171 @@ from hds_functions.data_aggregation import (
     select_top_rows,
 )
 
+# Explicit schema for the (group, value) DataFrames, avoiding schema inference
+GROUP_VALUE_SCHEMA = StructType(
+    [
+        StructField("group", StringType(), nullable=True),
+        StructField("value", IntegerType(), nullable=True),
+    ]
+)
 
-@pytest.fixture(scope="session")
-def spark():
-    """Create a SparkSession fixture for running tests."""
-    return (
-        SparkSession.builder.appName("data-aggregation-tests")
-        .master("local[*]")
-        .getOrCreate()
-    )
+# Rows used for global top-N rank tests
+UNPARTITIONED_RANK_DATA = [
+    ("A", 1),
+    ("B", 1),
+    ("C", None),
+    ("D", 2),
+    ("E", 3),
+]
 
 
-@pytest.mark.parametrize("func", [first_row, first_rank, first_dense_rank])
-def test_top_1_per_partition(spark, func):
-    """Test that top 1 row per group is returned for all methods."""
-    df = spark.createDataFrame(
+@pytest.fixture(scope="session")
+def df_groups(spark):
+    """DataFrame with two groups of distinct values, shared across tests."""
+    return spark.createDataFrame(
         [
             ("A", 3),
             ("A", 1),
             ("B", 2),
             ("B", 4),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
-    result = func(df, n=1, partition_by=["group"], order_by=[F.asc("value")])
+
+@pytest.fixture(scope="session")
+def df_with_nulls(spark):
+    """DataFrame with a single group containing a NULL value, shared across tests."""
+    return spark.createDataFrame(
+        [
+            ("A", None),
+            ("A", 2),
+            ("A", 1),
+        ],
+        GROUP_VALUE_SCHEMA,
+    )
+
+
+@pytest.fixture(scope="session")
+def df_ties_and_nulls(spark):
+    """Ungrouped DataFrame with tied and NULL values, shared across tests."""
+    return spark.createDataFrame(UNPARTITIONED_RANK_DATA, GROUP_VALUE_SCHEMA)
+
+
+@pytest.mark.parametrize("func", [first_row, first_rank, first_dense_rank])
+def test_top_1_per_partition(spark, df_groups, func):
+    """Test that top 1 row per group is returned for all methods."""
+    result = func(df_groups, n=1, partition_by=["group"], order_by=[F.asc("value")])
     expected = spark.createDataFrame(
         [
             ("A", 1),
             ("B", 2),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     assertDataFrameEqual(result.orderBy("group"), expected.orderBy("group"))
 
 
-def test_null_values_first_row(spark):
+def test_null_values_first_row(spark, df_with_nulls):
     """Test that NULLs are treated as smallest values by default."""
-    df = spark.createDataFrame(
+    result = first_row(
+        df_with_nulls, n=2, partition_by=["group"], order_by=[F.asc("value")]
+    )
+    expected = spark.createDataFrame(
         [
             ("A", None),
-            ("A", 2),
             ("A", 1),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
+    )
+
+    assertDataFrameEqual(result.orderBy("value"), expected.orderBy("value"))
+
+
+def test_first_row_by_column_names(spark):
+    """Test first row per group ordered by column names, retaining other columns."""
+    df = spark.createDataFrame(
+        [
+            ("x", "A", 2),
+            ("y", "A", None),
+            ("z", "B", 4),
+            ("w", "B", 3),
+        ],
+        ["tag", "group", "value"],
     )
 
-    result = first_row(df, n=2, partition_by=["group"], order_by=[F.asc("value")])
+    result = first_row(
+        df,
+        n=1,
+        partition_by=["group"],
+        order_by=["value"],
+        return_index_column=True,
+    )
     expected = spark.createDataFrame(
         [
-            ("A", None),
-            ("A", 1),
+            ("y", "A", None, 1),
+            ("w", "B", 3, 1),
         ],
-        ["group", "value"],
+        "tag string, group string, value long, row_index int",
     )
 
-    assertDataFrameEqual(result.orderBy("value"), expected.orderBy("value"))
+    assertDataFrameEqual(result.orderBy("group"), expected.orderBy("group"))
 
 
-def test_null_values_explicit_ordering(spark):
-    """Test NULL ordering behavior using asc_nulls_last()."""
+def test_first_row_with_map_column(spark):
+    """Test first row per group when another column has an unorderable map type."""
     df = spark.createDataFrame(
         [
-            ("A", None),
-            ("A", 2),
-            ("A", 1),
+            ("A", 2, {"k": 1}),
+            ("A", 1, {"k": 2}),
+            ("B", 3, {"k": 3}),
+        ],
+        "group string, value int, attributes map<string,int>",
+    )
+
+    result = first_row(df, partition_by=["group"], order_by=["value"])
+
+    assert sorted(result.collect()) == [("A", 1, {"k": 2}), ("B", 3, {"k": 3})]
+
+
+def test_first_row_with_dotted_column_names(spark):
+    """Test first row per group when column names contain dots."""
+    df = spark.createDataFrame(
+        [
+            ("x", "A", 2),
+            ("y", "A", 1),
+            ("z", "B", 4),
         ],
-        ["group", "value"],
+        "`tag.name` string, `group.id` string, `value.n` int",
     )
 
+    result = first_row(df, partition_by=["group.id"], order_by=["value.n"])
+    expected = spark.createDataFrame(
+        [
+            ("y", "A", 1),
+            ("z", "B", 4),
+        ],
+        "`tag.name` string, `group.id` string, `value.n` int",
+    )
+
+    assertDataFrameEqual(result, expected)
+
+
+def test_null_values_explicit_ordering(spark, df_with_nulls):
+    """Test NULL ordering behavior using asc_nulls_last()."""
     result = first_row(
-        df, n=2, partition_by=["group"], order_by=[F.col("value").asc_nulls_last()]
+        df_with_nulls,
+        n=2,
+        partition_by=["group"],
+        order_by=[F.col("value").asc_nulls_last()],
     )
     expected = spark.createDataFrame(
         [
             ("A", 1),
             ("A", 2),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     assertDataFrameEqual(result.orderBy("value"), expected.orderBy("value"))
@@ -119,7 +205,7 @@ def test_unpartitioned_input(spark):
             ("B", 1),
             ("C", 2),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     result = first_row(df, n=2, partition_by=None, order_by=[F.asc("value")])
@@ -128,12 +214,32 @@ def test_unpartitioned_input(spark):
             ("B", 1),
             ("C", 2),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     assertDataFrameEqual(result.orderBy("value"), expected.orderBy("value"))
 
 
+@pytest.mark.parametrize(
+    "func,n,expected_groups",
+    [
+        (first_rank, 2, ["A", "B", "C"]),
+        (first_rank, 3, ["A", "B", "C"]),
+        (first_dense_rank, 2, ["A", "B", "C"]),
+        (first_dense_rank, 3, ["A", "B", "C", "D"]),
+    ],
+)
+def test_unpartitioned_ranks(spark, df_ties_and_nulls, func, n, expected_groups):
+    """Test global top-N ranks with ties and NULLs when ordering by column names."""
+    result = func(df_ties_and_nulls, n=n, partition_by=None, order_by=["value"])
+    expected = spark.createDataFrame(
+        [row for row in UNPARTITIONED_RANK_DATA if row[0] in expected_groups],
+        GROUP_VALUE_SCHEMA,
+    )
+
+    assertDataFrameEqual(result.orderBy("group"), expected.orderBy("group"))
+
+
 def test_rank_with_ties(spark):
     """Test that rank includes all tied rows in the same rank."""
     df = spark.createDataFrame(
@@ -142,7 +248,7 @@ def test_rank_with_ties(spark):
             ("A", 1),
             ("A", 2),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     result = first_rank(df, n=1, partition_by=["group"], order_by=[F.asc("value")])
@@ -151,7 +257,7 @@ def test_rank_with_ties(spark):
             ("A", 1),
             ("A", 1),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     assertDataFrameEqual(result.orderBy("value"), expected.orderBy("value"))
@@ -166,7 +272,7 @@ def test_dense_rank_multiple_ranks(spark):
             ("A", 2),
             ("A", 3),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     result = first_dense_rank(
@@ -178,7 +284,7 @@ def test_dense_rank_multiple_ranks(spark):
             ("A", 1),
             ("A", 2),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     assertDataFrameEqual(result.orderBy("value"), expected.orderBy("value"))
@@ -191,7 +297,7 @@ def test_index_column_included(spark):
             ("A", 2),
             ("A", 1),
         ],
-        ["group", "value"],
+        GROUP_VALUE_SCHEMA,
     )
 
     result = first_row(
@@ -211,7 +317,7 @@ def test_index_column_included(spark):
 
 def test_invalid_method_raises(spark):
     """Test that invalid ranking method raises an assertion error."""
-    df = spark.createDataFrame([("A", 1)], ["group", "value"])
+    df = spark.createDataFrame([("A", 1)], GROUP_VALUE_SCHEMA)
 
     with pytest.raises(AssertionError, match="Invalid method"):
         select_top_rows(df, method="invalid", n=1)
@@ -222,4 +328,6 @@ def test_dummy_column_collision_raises(spark):
     df = spark.createDataFrame([("A", 1)], ["_dummy_column"])
 
     with pytest.raises(ValueError, match="already contains '_dummy_column'"):
-        select_top_rows(df, method="row_number", n=1, partition_by=None)
+        select_top_rows(
+            df, method="row_number", n=1, partition_by=None, return_index_column=True
+        )
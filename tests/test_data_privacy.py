@@ -11,140 +11,230 @@ Edge cases tested:
     - Custom redaction values (None, strings, integers)
     - Integration of rounding followed by redaction using DataFrame.transform()
 
-PySpark's assertDataFrameEqual is used to ensure accurate DataFrame comparison.
+DataFrames are compared with the collect-based assert_small_df_equal from
+tests/df_assertions.py, which is much cheaper than assertDataFrameEqual for tiny
+inputs.
 """
 
 import pytest
-from pyspark.sql import SparkSession
-from pyspark.testing import assertDataFrameEqual
+from pyspark.sql.types import LongType, StringType, StructField, StructType
 
 from hds_functions.data_privacy import (
     redact_low_counts,
     round_counts_to_multiple,
 )
+from tests.df_assertions import assert_small_df_equal
+
+# Explicit schemas skip Spark's type inference over the test data
+SCHEMA_ID_COUNT = StructType(
+    [StructField("id", LongType(), True), StructField("count", LongType(), True)]
+)
+SCHEMA_ID_COUNT_STRING = StructType(
+    [StructField("id", LongType(), True), StructField("count", StringType(), True)]
+)
+SCHEMA_ID_TWO_COUNTS = StructType(
+    [
+        StructField("id", LongType(), True),
+        StructField("count1", LongType(), True),
+        StructField("count2", LongType(), True),
+    ]
+)
+SCHEMA_ID_TWO_COUNTS_STRING = StructType(
+    [
+        StructField("id", LongType(), True),
+        StructField("count1", StringType(), True),
+        StructField("count2", StringType(), True),
+    ]
+)
+SCHEMA_SPECIAL_CHARACTERS = "id long, `count.a` long, `count``b` long"
 
 
 @pytest.fixture(scope="session")
-def spark():
-    """Create a SparkSession for testing."""
-    return (
-        SparkSession.builder.master("local[1]")
-        .appName("data-privacy-tests")
-        .getOrCreate()
-    )
+def tiny_df(spark):
+    """Single-row DataFrame shared by the input validation tests."""
+    return spark.createDataFrame([(1, 7)], schema=SCHEMA_ID_COUNT)
 
 
-def test_round_counts_to_multiple_basic(spark):
+@pytest.fixture(scope="session")
+def counts_3x2(spark):
+    """Cached three-row id/count DataFrame shared by rounding and redaction tests."""
+    return spark.createDataFrame(
+        [(1, 7), (2, 17), (3, 22)], schema=SCHEMA_ID_COUNT
+    ).cache()
+
+
+def test_round_counts_to_multiple_basic(spark, counts_3x2):
     """Test rounding counts to nearest multiple of 5 on single column."""
-    data = [(1, 7), (2, 17), (3, 22)]
-    df = spark.createDataFrame(data, ["id", "count"])
-    result = round_counts_to_multiple(df, ["count"], multiple=5)
+    result = round_counts_to_multiple(counts_3x2, ["count"], multiple=5)
 
     expected_data = [(1, 5), (2, 15), (3, 20)]
-    expected_df = spark.createDataFrame(expected_data, ["id", "count"])
+    expected_df = spark.createDataFrame(expected_data, schema=SCHEMA_ID_COUNT)
 
-    assertDataFrameEqual(result, expected_df)
+    assert_small_df_equal(result, expected_df)
 
 
 def test_round_counts_to_multiple_multiple_columns(spark):
     """Test rounding counts to nearest multiple on multiple columns."""
     data = [(1, 7, 12), (2, 17, 25)]
-    df = spark.createDataFrame(data, ["id", "count1", "count2"])
+    df = spark.createDataFrame(data, schema=SCHEMA_ID_TWO_COUNTS)
     result = round_counts_to_multiple(df, ["count1", "count2"], multiple=10)
 
     expected_data = [(1, 10, 10), (2, 20, 30)]
-    expected_df = spark.createDataFrame(expected_data, ["id", "count1", "count2"])
-
-    assertDataFrameEqual(result, expected_df)
+    expected_df = spark.createDataFrame(expected_data, schema=SCHEMA_ID_TWO_COUNTS)
 
+    assert_small_df_equal(result, expected_df)
 
-def test_round_counts_to_multiple_errors(spark):
-    """Test error handling for invalid inputs to round_counts_to_multiple."""
-    df = spark.createDataFrame([(1, 7)], ["id", "count"])
-
-    with pytest.raises(TypeError):
-        round_counts_to_multiple("not a df", ["count"])
 
-    with pytest.raises(TypeError):
-        round_counts_to_multiple(df, "count")  # columns not a list
+def test_special_character_column_names(spark):
+    """Test rounding and redaction on column names with dots and backticks."""
+    df = spark.createDataFrame([(1, 7, 12)], schema=SCHEMA_SPECIAL_CHARACTERS)
+    result = round_counts_to_multiple(df, ["count.a", "count`b"], multiple=5)
+    result = redact_low_counts(result, ["count.a", "count`b"], threshold=10)
 
-    with pytest.raises(TypeError):
-        round_counts_to_multiple(df, [1])  # columns list not strings
+    expected_df = spark.createDataFrame(
+        [(1, None, 10)], schema=SCHEMA_SPECIAL_CHARACTERS
+    )
 
-    with pytest.raises(ValueError):
-        round_counts_to_multiple(df, ["missing_col"])  # col doesn't exist
+    assert_small_df_equal(result, expected_df)
+
+
+@pytest.mark.parametrize(
+    "make_call,error",
+    [
+        pytest.param(
+            lambda df: round_counts_to_multiple("not a df", ["count"]),
+            TypeError,
+            id="df-not-dataframe",
+        ),
+        pytest.param(
+            lambda df: round_counts_to_multiple(df, "count"),
+            TypeError,
+            id="columns-not-list",
+        ),
+        pytest.param(
+            lambda df: round_counts_to_multiple(df, [1]),
+            TypeError,
+            id="columns-not-strings",
+        ),
+        pytest.param(
+            lambda df: round_counts_to_multiple(df, ["missing_col"]),
+            ValueError,
+            id="column-missing",
+        ),
+        pytest.param(
+            lambda df: round_counts_to_multiple(df, ["count"], multiple=0),
+            ValueError,
+            id="multiple-zero",
+        ),
+        pytest.param(
+            lambda df: round_counts_to_multiple(df, ["count"], multiple=-5),
+            ValueError,
+            id="multiple-negative",
+        ),
+    ],
+)
+def test_round_counts_to_multiple_errors(tiny_df, make_call, error):
+    """Test error handling for invalid inputs to round_counts_to_multiple."""
+    with pytest.raises(error):
+        make_call(tiny_df)
 
-    with pytest.raises(ValueError):
-        round_counts_to_multiple(df, ["count"], multiple=0)
 
-    with pytest.raises(ValueError):
-        round_counts_to_multiple(df, ["count"], multiple=-5)
+def test_empty_columns_returns_input(tiny_df):
+    """Test that an empty columns list returns the input DataFrame unchanged."""
+    assert round_counts_to_multiple(tiny_df, []) is tiny_df
+    assert redact_low_counts(tiny_df, [], threshold=5) is tiny_df
 
 
-def test_redact_low_counts_basic(spark):
+def test_redact_low_counts_basic(spark, counts_3x2):
     """Test basic redaction of counts below threshold with None as redaction."""
-    data = [(1, 7), (2, 17), (3, 3)]
-    df = spark.createDataFrame(data, ["id", "count"])
-    result = redact_low_counts(df, ["count"], threshold=10)
+    result = redact_low_counts(counts_3x2, ["count"], threshold=18)
 
-    expected_data = [(1, None), (2, 17), (3, None)]
-    expected_df = spark.createDataFrame(expected_data, ["id", "count"])
+    expected_data = [(1, None), (2, None), (3, 22)]
+    expected_df = spark.createDataFrame(expected_data, schema=SCHEMA_ID_COUNT)
 
-    assertDataFrameEqual(result, expected_df)
+    assert_small_df_equal(result, expected_df)
 
 
 def test_redact_low_counts_with_redaction_value_string(spark):
     """Test redaction of counts below threshold using a string redaction value."""
     data = [(1, 7), (2, 17)]
-    df = spark.createDataFrame(data, ["id", "count"])
+    df = spark.createDataFrame(data, schema=SCHEMA_ID_COUNT)
     result = redact_low_counts(df, ["count"], threshold=10, redaction_value="REDACTED")
 
-    expected_data = [(1, "REDACTED"), (2, 17)]
-    expected_df = spark.createDataFrame(expected_data, ["id", "count"])
+    expected_data = [(1, "REDACTED"), (2, "17")]
+    expected_df = spark.createDataFrame(expected_data, schema=SCHEMA_ID_COUNT_STRING)
 
-    assertDataFrameEqual(result, expected_df)
+    assert_small_df_equal(result, expected_df)
 
 
 def test_redact_low_counts_multiple_columns(spark):
     """Test redaction on multiple columns with custom redaction value."""
     data = [(1, 7, 15), (2, 17, 4)]
-    df = spark.createDataFrame(data, ["id", "count1", "count2"])
+    df = spark.createDataFrame(data, schema=SCHEMA_ID_TWO_COUNTS)
     result = redact_low_counts(
         df, ["count1", "count2"], threshold=10, redaction_value="X"
     )
 
-    expected_data = [(1, "X", 15), (2, 17, "X")]
-    expected_df = spark.createDataFrame(expected_data, ["id", "count1", "count2"])
-
-    assertDataFrameEqual(result, expected_df)
-
+    expected_data = [(1, "X", "15"), (2, "17", "X")]
+    expected_df = spark.createDataFrame(
+        expected_data, schema=SCHEMA_ID_TWO_COUNTS_STRING
+    )
 
-def test_redact_low_counts_errors(spark):
+    assert_small_df_equal(result, expected_df)
+
+
+@pytest.mark.parametrize(
+    "make_call,error,match",
+    [
+        pytest.param(
+            lambda df: redact_low_counts(df, ["count"], threshold=0),
+            ValueError,
+            None,
+            id="threshold-zero",
+        ),
+        pytest.param(
+            lambda df: redact_low_counts(df, ["count"], threshold=-10),
+            ValueError,
+            None,
+            id="threshold-negative",
+        ),
+        pytest.param(
+            lambda df: redact_low_counts(df, "count", threshold=5),
+            TypeError,
+            None,
+            id="columns-not-list",
+        ),
+        pytest.param(
+            lambda df: redact_low_counts(df, [1], threshold=5),
+            TypeError,
+            None,
+            id="columns-not-strings",
+        ),
+        pytest.param(
+            lambda df: redact_low_counts(df, ["missing_col"], threshold=5),
+            ValueError,
+            None,
+            id="column-missing",
+        ),
+        pytest.param(
+            lambda df: redact_low_counts(
+                df, ["missing_a", "count", "missing_b"], threshold=5
+            ),
+            ValueError,
+            "missing_a, missing_b",
+            id="all-missing-columns-reported",
+        ),
+    ],
+)
+def test_redact_low_counts_errors(tiny_df, make_call, error, match):
     """Test error handling for invalid inputs to redact_low_counts."""
-    df = spark.createDataFrame([(1, 7)], ["id", "count"])
+    with pytest.raises(error, match=match):
+        make_call(tiny_df)
 
-    with pytest.raises(ValueError):
-        redact_low_counts(df, ["count"], threshold=0)
 
-    with pytest.raises(ValueError):
-        redact_low_counts(df, ["count"], threshold=-10)
-
-    with pytest.raises(TypeError):
-        redact_low_counts(df, "count", threshold=5)  # columns not a list
-
-    with pytest.raises(TypeError):
-        redact_low_counts(df, [1], threshold=5)  # columns not strings
-
-    with pytest.raises(ValueError):
-        redact_low_counts(df, ["missing_col"], threshold=5)  # col missing
-
-
-def test_round_and_redact_integration(spark):
+def test_round_and_redact_integration(spark, counts_3x2):
     """Integration test chaining rounding and redaction with .transform()."""
-    data = [(1, 7), (2, 17), (3, 22)]
-    df = spark.createDataFrame(data, ["id", "count"])
-
-    result = df.transform(
+    result = counts_3x2.transform(
         lambda d: round_counts_to_multiple(d, columns=["count"], multiple=5)
     ).transform(
         lambda d: redact_low_counts(
@@ -153,6 +243,6 @@ def test_round_and_redact_integration(spark):
     )
 
     expected_data = [(1, 0), (2, 15), (3, 20)]
-    expected_df = spark.createDataFrame(expected_data, ["id", "count"])
+    expected_df = spark.createDataFrame(expected_data, schema=SCHEMA_ID_COUNT)
 
-    assertDataFrameEqual(result, expected_df)
+    assert_small_df_equal(result, expected_df)
@@ -0,0 +1,143 @@
+"""Unit tests for the pure-Python helpers in date_functions.py.
+
+These tests validate the correctness of date parsing and conversion utilities
+without starting Spark, including:
+    - validate_date_string: Checks if a date string is valid
+    - validate_date_strings: Checks many date strings in one batched call
+    - parse_date_instruction: Converts date strings into Spark SQL expressions
+    - convert_date_units: Converts units like days, weeks, months, or years
+      into Spark SQL interval literals, or day counts outside date arithmetic
+    - convert_date_units_to_days: Converts units into day counts
+
+Edge cases tested:
+    - Leap year and non-leap year date validation
+    - Invalid or nonsensical date strings
+    - Handling of None or empty input
+    - Complex date arithmetic (adding/subtracting days, weeks, months, or years)
+    - Units in function arguments, numeric comparisons and unary minus
+    - Invalid units in date expressions
+
+The module has no pyspark imports of its own and never requests the spark
+fixture, so running it on its own does not start a JVM.
+"""
+
+import pytest
+
+from hds_functions.date_functions import (
+    convert_date_units,
+    convert_date_units_to_days,
+    parse_date_instruction,
+    validate_date_string,
+    validate_date_strings,
+)
+from tests.date_cases import DATE_CASES, DATE_STRING_CASES
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_date_parser():
+    """Run each parse_date_instruction branch once before the timed tests.
+
+    This triggers lazy imports and first-call work up front, so per-test
+    timings (e.g. under pytest-benchmark) reflect steady-state behaviour.
+    """
+    parse_date_instruction("index_date + 1 day")
+    parse_date_instruction("2020-01-01")
+    parse_date_instruction(None)
+
+
+@pytest.mark.parametrize("date_str,expected", DATE_STRING_CASES)
+def test_validate_date_string(date_str, expected):
+    """Test validation of date strings for correctness."""
+    assert validate_date_string(date_str) is expected
+
+
+def test_validate_date_strings_batch():
+    """Test that batch validation matches per-string validation in one call."""
+    date_strings = [date_str for date_str, _ in DATE_STRING_CASES]
+    expected = [expected for _, expected in DATE_STRING_CASES]
+    assert validate_date_strings(date_strings) == expected
+
+
+@pytest.mark.parametrize(
+    "input_str,expected_output",
+    [(input_str, expected_output) for input_str, expected_output, _ in DATE_CASES]
+    + [
+        ("current_date() + 5 days", "current_date() + INTERVAL 5 DAY"),
+        ("random_expression", "random_expression"),
+    ],
+    ids=str,
+)
+def test_parse_date_instruction(input_str, expected_output):
+    """Test parsing of date instruction strings into expressions."""
+    assert parse_date_instruction(input_str) == expected_output
+
+
+def test_parse_date_instruction_invalid_date():
+    """Test that invalid date strings raise ValueError in parse_date_instruction."""
+    with pytest.raises(ValueError, match="Invalid date: 2020-02-30"):
+        parse_date_instruction("2020-02-30")
+
+
+@pytest.mark.parametrize(
+    "input_expr,expected_expr",
+    [
+        (input_str, expected_output)
+        for input_str, expected_output, _ in DATE_CASES
+        if input_str is not None
+        and ("INTERVAL" in expected_output or "cast(round" in expected_output)
+    ]
+    + [
+        ("index_date + 6 months", "index_date + INTERVAL 6 MONTH"),
+        (
+            "index_date - 2 years, x - 7.5 weeks",
+            "index_date - INTERVAL 2 YEAR, x - INTERVAL 53 DAY",
+        ),
+        ("date_col + 1 day", "date_col + INTERVAL 1 DAY"),
+        (
+            "2 years, 3 months",
+            "cast(round(2*365.25) as int), cast(round(3*30) as int)",
+        ),
+        ("date_add(x, -5 days)", "date_add(x, -cast(round(5*1) as int))"),
+        ("datediff(x, y) >= 2 weeks", "datediff(x, y) >= cast(round(2*7) as int)"),
+        ("x + 1.5 days, y + 105 days", "x + INTERVAL 2 DAY, y + INTERVAL 105 DAY"),
+        ("x + 0.1 years, y + 1.5 months", "x + INTERVAL 37 DAY, y + INTERVAL 45 DAY"),
+    ],
+    ids=str,
+)
+def test_convert_date_units(input_expr, expected_expr):
+    """Test conversion of date units into intervals, or days outside arithmetic."""
+    assert convert_date_units(input_expr) == expected_expr
+
+
+def test_convert_date_units_invalid_unit():
+    """Test that invalid date units raise ValueError in convert_date_units."""
+    with pytest.raises(ValueError, match="Invalid unit"):
+        convert_date_units("index_date + 5 decades")
+
+
+@pytest.mark.parametrize(
+    "input_expr,expected_expr",
+    [
+        ("index_date + 6 months", "index_date + cast(round(6*30) as int)"),
+        ("x - 7.5 weeks", "x - cast(round(7.5*7) as int)"),
+        (
+            "index_date - 2 years, x - 7.5 weeks",
+            "index_date - cast(round(2*365.25) as int), x - cast(round(7.5*7) as int)",
+        ),
+        ("date_col + 1 day", "date_col + cast(round(1*1) as int)"),
+        (
+            "x + 1.5 days, y + 105 days",
+            "x + cast(round(1.5*1) as int), y + cast(round(105*1) as int)",
+        ),
+    ],
+    ids=str,
+)
+def test_convert_date_units_to_days(input_expr, expected_expr):
+    """Test conversion of date units (days, weeks, months, years) into days."""
+    assert convert_date_units_to_days(input_expr) == expected_expr
+
+
+def test_convert_date_units_to_days_invalid_unit():
+    """Test that invalid date units raise ValueError in convert_date_units_to_days."""
+    with pytest.raises(ValueError, match="Invalid unit"):
+        convert_date_units_to_days("index_date + 5 decades")
@@ -0,0 +1,77 @@
+"""Unit tests for environment_utils.py.
+
+These tests validate the caching in get_spark_session with a mocked
+SparkSession, including:
+    - Reusing the cached session without querying the active session
+    - Creating a new session once the cached one has been stopped
+    - Spark Connect sessions, where reading `sparkContext` is not supported
+    - Classic sessions, whose SparkContext clears its Java context when stopped
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from hds_functions import environment_utils
+from hds_functions.environment_utils import get_spark_session, is_session_stopped
+
+
+class ConnectLikeSession:
+    """Stand-in for a Spark Connect session, which has no SparkContext."""
+
+    def __init__(self, is_stopped=False):
+        """Create a session reporting the given stopped state."""
+        self.is_stopped = is_stopped
+
+    @property
+    def sparkContext(self):
+        """Raise like Spark Connect sessions do."""
+        raise NotImplementedError("sparkContext() is not implemented.")
+
+
+@pytest.fixture
+def mock_spark_session(monkeypatch):
+    """Patch SparkSession in environment_utils and clear the cached session."""
+    monkeypatch.setattr(environment_utils, "_SPARK_SESSION", None)
+    spark_session = mock.MagicMock()
+    monkeypatch.setattr(environment_utils, "SparkSession", spark_session)
+    return spark_session
+
+
+def test_get_spark_session_reuses_cached_session(mock_spark_session):
+    """Test that a cache hit skips getOrCreate and the active session lookup."""
+    session = ConnectLikeSession()
+    get_or_create = mock_spark_session.builder.appName.return_value.getOrCreate
+    get_or_create.return_value = session
+
+    assert get_spark_session() is session
+    assert get_spark_session() is session
+    get_or_create.assert_called_once_with()
+    mock_spark_session.getActiveSession.assert_not_called()
+
+
+def test_get_spark_session_replaces_stopped_session(mock_spark_session):
+    """Test that a new session is created once the cached one is stopped."""
+    first, second = ConnectLikeSession(), ConnectLikeSession()
+    get_or_create = mock_spark_session.builder.appName.return_value.getOrCreate
+    get_or_create.side_effect = [first, second]
+
+    assert get_spark_session() is first
+    first.is_stopped = True
+    assert get_spark_session() is second
+
+
+@pytest.mark.parametrize(
+    "session,expected",
+    [
+        pytest.param(SimpleNamespace(_sc=SimpleNamespace(_jsc=object())), False),
+        pytest.param(SimpleNamespace(_sc=SimpleNamespace(_jsc=None)), True),
+        pytest.param(ConnectLikeSession(), False),
+        pytest.param(ConnectLikeSession(is_stopped=True), True),
+    ],
+    ids=["classic-active", "classic-stopped", "connect-active", "connect-stopped"],
+)
+def test_is_session_stopped(session, expected):
+    """Test stopped-session detection for classic and Spark Connect sessions."""
+    assert is_session_stopped(session) is expected
@@ -0,0 +1,208 @@
+"""Unit tests for json_utils.py.
+
+These tests validate reading JSON files, including:
+    - read_json_file: Reads a JSON file into a dictionary, caching checked text
+    - parse_json_text: Parses JSON text with orjson when installed
+    - write_json_file: Writes a dictionary to a JSON file
+
+Edge cases tested:
+    - Repeated reads of an unchanged file hitting the cache
+    - Rewrites picked up through a new modification time or size
+    - Same-size rewrites within the timestamp resolution returning cached content
+    - Duplicate keys, which raise on every read unless not checked
+    - A fresh dictionary on every call, including cache hits
+    - The orjson fast path, and falling back to json for NaN and big integers
+    - Indented output by default, compact output and missing directories
+
+JSON fixtures are written to pytest's tmp_path and read by absolute path. Each test
+starts from an empty cache.
+"""
+
+import json
+import math
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from hds_functions import json_utils
+from hds_functions.json_utils import parse_json_text, read_json_file, write_json_file
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    """Give each test its own empty JSON text cache."""
+    monkeypatch.setattr(json_utils, "_JSON_TEXT_CACHE", {})
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    """Record the paths read from disk by load_json_text."""
+    calls = []
+    load_json_text = json_utils.load_json_text
+
+    def recording_load_json_text(resolved_path, check_duplicates=True):
+        calls.append(resolved_path)
+        return load_json_text(resolved_path, check_duplicates)
+
+    monkeypatch.setattr(json_utils, "load_json_text", recording_load_json_text)
+    return calls
+
+
+def write_text(path, text, mtime_ns=None):
+    """Write text to path, optionally setting its modification time."""
+    path.write_text(text)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+def test_read_json_file_cache_hit(tmp_path, load_calls):
+    """Test that repeated reads of an unchanged file are read from disk once."""
+    path = write_text(tmp_path / "config.json", '{"a": 1, "b": [1, 2]}')
+
+    assert read_json_file(path) == {"a": 1, "b": [1, 2]}
+    assert read_json_file(path) == {"a": 1, "b": [1, 2]}
+    assert load_calls == [path]
+
+
+def test_read_json_file_fresh_dict_per_call(tmp_path):
+    """Test that mutating a returned dictionary does not affect later reads."""
+    path = write_text(tmp_path / "config.json", '{"a": {"b": 1}}')
+
+    first = read_json_file(path)
+    first["a"]["b"] = 2
+    second = read_json_file(path)
+    second["c"] = 3
+
+    assert read_json_file(path) == {"a": {"b": 1}}
+    assert first is not second
+
+
+@pytest.mark.parametrize(
+    "new_text,mtime_offset_ns",
+    [
+        pytest.param('{"a": 2}', 1_000_000_000, id="new_mtime"),
+        pytest.param('{"a": 22}', 0, id="new_size"),
+    ],
+)
+def test_read_json_file_rewrite_invalidates(
+    tmp_path, load_calls, new_text, mtime_offset_ns
+):
+    """Test that a rewrite with a new modification time or size is re-read."""
+    mtime_ns = 1_700_000_000_000_000_000
+    path = write_text(tmp_path / "config.json", '{"a": 1}', mtime_ns)
+    assert read_json_file(path) == {"a": 1}
+
+    write_text(tmp_path / "config.json", new_text, mtime_ns + mtime_offset_ns)
+
+    assert read_json_file(path) == json.loads(new_text)
+    assert load_calls == [path, path]
+
+
+def test_read_json_file_same_size_rewrite_is_stale(tmp_path):
+    """Test the documented window: a same-size, same-mtime rewrite is not seen."""
+    mtime_ns = 1_700_000_000_000_000_000
+    path = write_text(tmp_path / "config.json", '{"a": 1}', mtime_ns)
+    assert read_json_file(path) == {"a": 1}
+
+    write_text(tmp_path / "config.json", '{"a": 2}', mtime_ns)
+
+    assert read_json_file(path) == {"a": 1}
+
+
+def test_read_json_file_duplicate_keys(tmp_path, load_calls):
+    """Test that duplicate keys raise on every read and are never cached."""
+    path = write_text(tmp_path / "config.json", '{"a": 1, "b": {"c": 1, "c": 2}}')
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="contains duplicate key: c"):
+            read_json_file(path)
+    assert load_calls == [path, path]
+    assert json_utils._JSON_TEXT_CACHE == {}
+
+
+def test_read_json_file_unchecked_duplicates(tmp_path):
+    """Test that unchecked duplicates keep the last value, cached separately."""
+    path = write_text(tmp_path / "config.json", '{"a": 1, "a": 2}')
+
+    assert read_json_file(path, check_duplicates=False) == {"a": 2}
+    assert read_json_file(path, check_duplicates=False) == {"a": 2}
+    with pytest.raises(ValueError, match="contains duplicate key: a"):
+        read_json_file(path)
+
+
+def test_read_json_file_uses_orjson_on_cache_hit(tmp_path, monkeypatch):
+    """Test that cached text is parsed with orjson when it is installed."""
+    orjson = pytest.importorskip("orjson")
+    parsed = []
+
+    def recording_loads(json_text):
+        parsed.append(json_text)
+        return orjson.loads(json_text)
+
+    monkeypatch.setattr(
+        json_utils,
+        "orjson",
+        SimpleNamespace(loads=recording_loads, JSONDecodeError=orjson.JSONDecodeError),
+    )
+    path = write_text(tmp_path / "config.json", '{"a": [1, 2.5, "x"]}')
+
+    assert read_json_file(path) == {"a": [1, 2.5, "x"]}
+    assert parsed == []
+    assert read_json_file(path) == {"a": [1, 2.5, "x"]}
+    assert parsed == ['{"a": [1, 2.5, "x"]}']
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+def test_parse_json_text_falls_back_for_nan_and_big_integers(monkeypatch, use_orjson):
+    """Test that text orjson rejects is parsed with json, with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+    assert parse_json_text('{"big": 18446744073709551616}') == {
+        "big": 18446744073709551616
+    }
+    result = parse_json_text('{"nan": NaN, "inf": Infinity}')
+    assert math.isnan(result["nan"])
+    assert result["inf"] == math.inf
+
+
+def test_read_json_file_nan_on_cache_hit(tmp_path):
+    """Test that a cached file orjson rejects still reads back on a cache hit."""
+    path = write_text(tmp_path / "config.json", '{"a": NaN, "b": 1}')
+
+    for _ in range(2):
+        result = read_json_file(path)
+        assert math.isnan(result["a"])
+        assert result["b"] == 1
+
+
+DATA = {"name": "caf\u00e9", "values": [1, 2.5, None], "nested": {"a": True}}
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_indent",
+    [
+        pytest.param({}, 4, id="default"),
+        pytest.param({"indent": 2}, 2, id="indent_2"),
+        pytest.param({"indent": None}, None, id="compact"),
+    ],
+)
+def test_write_json_file(tmp_path, kwargs, expected_indent):
+    """Test that output matches json.dump and reads back unchanged."""
+    path = str(tmp_path / "written.json")
+
+    write_json_file(DATA, path, **kwargs)
+
+    with open(path) as json_file:
+        assert json_file.read() == json.dumps(DATA, indent=expected_indent)
+    assert read_json_file(path) == DATA
+
+
+def test_write_json_file_missing_directory(tmp_path):
+    """Test that writing into a missing directory raises ValueError."""
+    with pytest.raises(ValueError, match="does not exist"):
+        write_json_file(DATA, str(tmp_path / "missing" / "written.json"))